@@ -4,9 +4,10 @@ Authentication endpoints.
 This module handles user registration, login, and profile management.
 """
 
+import asyncio
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
-from firebase_admin import auth as firebase_auth
+from google.api_core.exceptions import AlreadyExists, NotFound
 
 from app.models.schemas import (
     UserRegisterRequest,
@@ -18,10 +19,22 @@ from app.models.schemas import (
     PasswordChangeRequest,
     ErrorResponse
 )
-from app.dependencies import get_firestore_repository, get_current_user
+from app.dependencies import (
+    get_firestore_repository,
+    get_current_user,
+    cache_user,
+    invalidate_clubs_cache
+)
 from app.repositories.firestore_repo import FirestoreRepository
 from app.utils.validators import validate_club_id, validate_nickname
-from app.utils.security import hash_password, verify_password, create_access_token, verify_password_with_firebase
+from app.utils.security import (
+    create_access_token,
+    verify_password_with_firebase,
+    create_firebase_user,
+    delete_firebase_user,
+    update_firebase_user,
+    FirebaseAuthError
+)
 from app.utils.error_handlers import handle_exceptions, validate_and_raise, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -29,12 +42,38 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
 
+def _build_profile_response(user: dict, user_id: str) -> UserProfileResponse:
+    """
+    Build UserProfileResponse from a Firestore user document.
+
+    Skips validation since the data comes from our own database.
+    """
+    return UserProfileResponse.model_construct(
+        user_id=user_id,
+        email=user["email"],
+        nickname=user["nickname"],
+        club_id=user["club_id"],
+        total_points=user.get("total_points", 0),
+        created_at=user.get("created_at"),
+        updated_at=user.get("updated_at")
+    )
+
+
+async def _discard_firebase_user(user_id: str) -> None:
+    """Delete a Firebase Auth account whose registration failed, logging any error."""
+    try:
+        await delete_firebase_user(user_id)
+    except Exception as e:
+        logger.error(f"Failed to delete orphaned Firebase user {user_id}: {str(e)}")
+
+
 @router.post(
     "/register",
     response_model=UserLoginResponse,
     status_code=status.HTTP_201_CREATED,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid input"},
+        404: {"model": ErrorResponse, "description": "Club not found"},
         409: {"model": ErrorResponse, "description": "User already exists"}
     }
 )
@@ -68,26 +107,29 @@ async def register(
     is_valid, error_msg = validate_nickname(request.nickname)
     validate_and_raise(is_valid, error_msg)
 
-    # Check if user already exists
-    existing_user = await repo.get_user_by_email(request.email)
-    if existing_user:
+    # Check the club before creating the Auth account, so a missing club
+    # document never leaves an orphaned account behind
+    if not await repo.get_club(request.club_id):
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="User with this email already exists"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Club {request.club_id} not found"
         )
 
-    # Create user in Firebase Auth
+    # Create user in Firebase Auth (rejects duplicate emails)
     try:
-        firebase_user = firebase_auth.create_user(
-            email=request.email,
-            password=request.password,
-            display_name=request.nickname
+        user_id = await create_firebase_user(
+            request.email, request.password, request.nickname
         )
-        user_id = firebase_user.uid
-    except firebase_auth.EmailAlreadyExistsError:
+    except FirebaseAuthError as e:
+        if e.message == "EMAIL_EXISTS":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Email already in use"
+            )
+        logger.error(f"Firebase Auth error: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Email already in use"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create user account"
         )
     except Exception as e:
         logger.error(f"Firebase Auth error: {str(e)}")
@@ -105,11 +147,25 @@ async def register(
         "total_steps": 0
     }
 
-    await repo.create_user(user_id, user_data)
-
-    # Increment club member count
-    await repo.get_club(request.club_id)  # Ensure club exists
-    # Note: In production, you'd want to increment active_members here
+    # Create user and increment club member count in one transaction
+    # (on failure, delete the Auth account so the email can register again)
+    try:
+        await repo.create_user_and_bump_club(user_id, user_data, request.club_id)
+    except NotFound:
+        await _discard_firebase_user(user_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Club {request.club_id} not found"
+        )
+    except AlreadyExists:
+        await _discard_firebase_user(user_id)
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="User with this email already exists"
+        )
+    except Exception:
+        await _discard_firebase_user(user_id)
+        raise
 
     # Generate access token
     access_token = create_access_token(data={"sub": user_id, "email": request.email})
@@ -154,7 +210,7 @@ async def login(
         HTTPException: If login fails
     """
     # Step 1: Verify password with Firebase Auth
-    firebase_result = verify_password_with_firebase(request.email, request.password)
+    firebase_result = await verify_password_with_firebase(request.email, request.password)
 
     if not firebase_result:
         raise HTTPException(
@@ -209,15 +265,7 @@ async def get_profile(
     Returns:
         UserProfileResponse with user profile data
     """
-    return UserProfileResponse(
-        user_id=current_user["user_id"],
-        email=current_user["email"],
-        nickname=current_user["nickname"],
-        club_id=current_user["club_id"],
-        total_points=current_user.get("total_points", 0),
-        created_at=current_user.get("created_at"),
-        updated_at=current_user.get("updated_at")
-    )
+    return _build_profile_response(current_user, current_user["user_id"])
 
 
 @router.patch(
@@ -225,7 +273,8 @@ async def get_profile(
     response_model=UserProfileResponse,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid input"},
-        401: {"model": ErrorResponse, "description": "Unauthorized"}
+        401: {"model": ErrorResponse, "description": "Unauthorized"},
+        404: {"model": ErrorResponse, "description": "Club not found"}
     }
 )
 @handle_exceptions("Profile update")
@@ -264,22 +313,26 @@ async def update_profile(
         )
         update_data["club_id"] = request.club_id
 
-    # Update user in Firestore
-    if update_data:
+    # Update user in Firestore, moving club membership counts if needed
+    old_club_id = current_user.get("club_id")
+    if update_data.get("club_id", old_club_id) != old_club_id:
+        try:
+            await repo.move_user_to_club(current_user["user_id"], old_club_id, update_data)
+        except NotFound:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Club {request.club_id} not found"
+            )
+        await invalidate_clubs_cache(filter(None, (old_club_id, request.club_id)))
+    elif update_data:
         await repo.update_user(current_user["user_id"], update_data)
 
-    # Get updated user data
-    updated_user = await repo.get_user(current_user["user_id"])
-
-    return UserProfileResponse(
-        user_id=current_user["user_id"],
-        email=updated_user["email"],
-        nickname=updated_user["nickname"],
-        club_id=updated_user["club_id"],
-        total_points=updated_user.get("total_points", 0),
-        created_at=updated_user.get("created_at"),
-        updated_at=updated_user.get("updated_at")
-    )
+    # Build response from the applied patch instead of re-reading
+    updated_user = {**current_user, **update_data}
+    if update_data:
+        await cache_user(current_user["user_id"], updated_user)
+
+    return _build_profile_response(updated_user, current_user["user_id"])
 
 
 @router.put(
@@ -311,10 +364,11 @@ async def update_email(
     Raises:
         HTTPException: If update fails
     """
-    # Step 1: Verify current password
-    verify_result = verify_password_with_firebase(
-        current_user["email"],
-        request.password
+    # Step 1: Verify current password and check if new email is already in use
+    # (independent network calls, run concurrently)
+    verify_result, existing_user = await asyncio.gather(
+        verify_password_with_firebase(current_user["email"], request.password),
+        repo.get_user_by_email(request.new_email)
     )
 
     if not verify_result:
@@ -323,8 +377,7 @@ async def update_email(
             detail="Invalid password"
         )
 
-    # Step 2: Check if new email is already in use
-    existing_user = await repo.get_user_by_email(request.new_email)
+    # Step 2: Reject if new email is already in use
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -333,14 +386,17 @@ async def update_email(
 
     # Step 3: Update email in Firebase Auth
     try:
-        firebase_auth.update_user(
-            current_user["user_id"],
-            email=request.new_email
-        )
-    except firebase_auth.EmailAlreadyExistsError:
+        await update_firebase_user(current_user["user_id"], email=request.new_email)
+    except FirebaseAuthError as e:
+        if e.message == "EMAIL_EXISTS":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Email already in use"
+            )
+        logger.error(f"Firebase Auth email update error: {e.message}")
         raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Email already in use"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to update email in authentication system"
         )
     except Exception as e:
         logger.error(f"Firebase Auth email update error: {str(e)}")
@@ -350,22 +406,16 @@ async def update_email(
         )
 
     # Step 4: Update email in Firestore
-    await repo.update_user(current_user["user_id"], {"email": request.new_email})
+    update_data = {"email": request.new_email}
+    await repo.update_user(current_user["user_id"], update_data)
 
-    # Step 5: Get updated user data
-    updated_user = await repo.get_user(current_user["user_id"])
+    # Step 5: Build response from the applied patch instead of re-reading
+    updated_user = {**current_user, **update_data}
+    await cache_user(current_user["user_id"], updated_user)
 
     logger.info(f"Email updated successfully for user: {current_user['user_id']}")
 
-    return UserProfileResponse(
-        user_id=current_user["user_id"],
-        email=updated_user["email"],
-        nickname=updated_user["nickname"],
-        club_id=updated_user["club_id"],
-        total_points=updated_user.get("total_points", 0),
-        created_at=updated_user.get("created_at"),
-        updated_at=updated_user.get("updated_at")
-    )
+    return _build_profile_response(updated_user, current_user["user_id"])
 
 
 @router.put(
@@ -395,7 +445,7 @@ async def change_password(
         HTTPException: If password change fails
     """
     # Step 1: Verify current password
-    verify_result = verify_password_with_firebase(
+    verify_result = await verify_password_with_firebase(
         current_user["email"],
         request.current_password
     )
@@ -415,10 +465,7 @@ async def change_password(
 
     # Step 3: Update password in Firebase Auth
     try:
-        firebase_auth.update_user(
-            current_user["user_id"],
-            password=request.new_password
-        )
+        await update_firebase_user(current_user["user_id"], password=request.new_password)
     except Exception as e:
         logger.error(f"Firebase Auth password update error: {str(e)}")
         raise HTTPException(
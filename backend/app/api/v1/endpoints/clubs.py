@@ -4,8 +4,10 @@ Club information endpoints.
 This module handles club data retrieval and statistics.
 """
 
+import asyncio
+import hashlib
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status, Path
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Request, Response
 
 from app.models.schemas import (
     ClubInfo,
@@ -13,7 +15,15 @@ from app.models.schemas import (
     ClubStatsResponse,
     ErrorResponse
 )
-from app.dependencies import get_firestore_repository, get_current_user
+from app.dependencies import (
+    CLUB_LIST_KEY,
+    get_firestore_repository,
+    get_current_user,
+    get_cached_club_response,
+    cache_club_response,
+    invalidate_cached_user,
+    invalidate_clubs_cache
+)
 from app.repositories.firestore_repo import FirestoreRepository
 from app.utils.error_handlers import handle_exceptions
 
@@ -21,6 +31,43 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/clubs", tags=["clubs"])
 
+# Club data is public and changes on the order of minutes
+_CLUB_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+_STATS_CACHE_CONTROL = "public, max-age=15"
+
+
+def _cacheable_response(request: Request, body: str, cache_control: str) -> Response:
+    """
+    Build a JSON response with ETag and Cache-Control headers.
+
+    Returns 304 Not Modified if the client's If-None-Match matches.
+    """
+    etag = f'"{hashlib.blake2b(body.encode(), digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _build_club_info(club: dict, club_id: str) -> ClubInfo:
+    """
+    Build ClubInfo from a Firestore club document.
+
+    Skips validation since the data comes from our own database.
+    """
+    return ClubInfo.model_construct(
+        club_id=club_id,
+        name=club.get("name", ""),
+        total_points=club.get("total_points", 0),
+        active_members=club.get("active_members", 0),
+        league_rank=club.get("league_rank", 0),
+        founded_year=club.get("founded_year", 1900),
+        stadium=club.get("stadium", ""),
+        logo_url=club.get("logo_url")
+    )
+
 
 @router.get(
     "",
@@ -29,8 +76,9 @@ router = APIRouter(prefix="/clubs", tags=["clubs"])
 )
 @handle_exceptions("Get all clubs")
 async def get_all_clubs(
+    request: Request,
     repo: FirestoreRepository = Depends(get_firestore_repository)
-) -> ClubListResponse:
+) -> Response:
     """
     Get list of all J-League clubs.
 
@@ -41,37 +89,30 @@ async def get_all_clubs(
     - League ranking
 
     Args:
+        request: Incoming request (for If-None-Match)
         repo: Firestore repository
 
     Returns:
-        ClubListResponse with list of all clubs
+        ClubListResponse JSON with list of all clubs
 
     Raises:
         HTTPException: If retrieval fails
     """
-    clubs_data = await repo.get_all_clubs()
+    body = await get_cached_club_response(CLUB_LIST_KEY)
+    if body is not None:
+        return _cacheable_response(request, body, _CLUB_CACHE_CONTROL)
 
-    clubs = [
-        ClubInfo(
-            club_id=club.get("club_id", ""),
-            name=club.get("name", ""),
-            total_points=club.get("total_points", 0),
-            active_members=club.get("active_members", 0),
-            league_rank=club.get("league_rank", 0),
-            founded_year=club.get("founded_year", 1900),
-            stadium=club.get("stadium", ""),
-            logo_url=club.get("logo_url")
-        )
-        for club in clubs_data
-    ]
+    clubs_data = await repo.get_all_clubs()
 
-    # Sort by total points descending
-    clubs.sort(key=lambda x: x.total_points, reverse=True)
+    # Already ordered by total points descending in the repository
+    clubs = [_build_club_info(club, club.get("club_id", "")) for club in clubs_data]
 
-    return ClubListResponse(
+    body = ClubListResponse.model_construct(
         total_clubs=len(clubs),
         clubs=clubs
-    )
+    ).model_dump_json()
+    await cache_club_response(CLUB_LIST_KEY, body)
+    return _cacheable_response(request, body, _CLUB_CACHE_CONTROL)
 
 
 @router.get(
@@ -83,22 +124,28 @@ async def get_all_clubs(
 )
 @handle_exceptions("Get club")
 async def get_club(
+    request: Request,
     club_id: str = Path(..., description="Club identifier"),
     repo: FirestoreRepository = Depends(get_firestore_repository)
-) -> ClubInfo:
+) -> Response:
     """
     Get specific club information.
 
     Args:
+        request: Incoming request (for If-None-Match)
         club_id: Club identifier
         repo: Firestore repository
 
     Returns:
-        ClubInfo with club details
+        ClubInfo JSON with club details
 
     Raises:
         HTTPException: If club not found
     """
+    body = await get_cached_club_response(club_id)
+    if body is not None:
+        return _cacheable_response(request, body, _CLUB_CACHE_CONTROL)
+
     club = await repo.get_club(club_id)
 
     if not club:
@@ -107,16 +154,9 @@ async def get_club(
             detail=f"Club {club_id} not found"
         )
 
-    return ClubInfo(
-        club_id=club_id,
-        name=club.get("name", ""),
-        total_points=club.get("total_points", 0),
-        active_members=club.get("active_members", 0),
-        league_rank=club.get("league_rank", 0),
-        founded_year=club.get("founded_year", 1900),
-        stadium=club.get("stadium", ""),
-        logo_url=club.get("logo_url")
-    )
+    body = _build_club_info(club, club_id).model_dump_json()
+    await cache_club_response(club_id, body)
+    return _cacheable_response(request, body, _CLUB_CACHE_CONTROL)
 
 
 @router.get(
@@ -128,9 +168,10 @@ async def get_club(
 )
 @handle_exceptions("Get club stats")
 async def get_club_stats(
+    request: Request,
     club_id: str = Path(..., description="Club identifier"),
     repo: FirestoreRepository = Depends(get_firestore_repository)
-) -> ClubStatsResponse:
+) -> Response:
     """
     Get detailed club statistics.
 
@@ -142,16 +183,21 @@ async def get_club_stats(
     - Top contributors
 
     Args:
+        request: Incoming request (for If-None-Match)
         club_id: Club identifier
         repo: Firestore repository
 
     Returns:
-        ClubStatsResponse with detailed statistics
+        ClubStatsResponse JSON with detailed statistics
 
     Raises:
         HTTPException: If club not found
     """
-    club = await repo.get_club(club_id)
+    # Club document and member count are independent reads
+    club, member_count = await asyncio.gather(
+        repo.get_club(club_id),
+        repo.get_club_members_count(club_id)
+    )
 
     if not club:
         raise HTTPException(
@@ -159,25 +205,19 @@ async def get_club_stats(
             detail=f"Club {club_id} not found"
         )
 
-    # Get member count
-    member_count = await repo.get_club_members_count(club_id)
-
     # TODO: Implement weekly/monthly points calculation
     # TODO: Implement top contributors retrieval
-    # For Phase 1, return basic stats
+    # For Phase 1, return basic stats (unimplemented fields are omitted)
 
-    return ClubStatsResponse(
+    body = ClubStatsResponse.model_construct(
         club_id=club_id,
         name=club.get("name", ""),
         total_points=club.get("total_points", 0),
         total_steps=club.get("total_steps", 0),
         active_members=member_count,
-        weekly_points=0,  # TODO: Implement
-        monthly_points=0,  # TODO: Implement
-        league_rank=club.get("league_rank", 0),
-        weekly_rank=0,  # TODO: Implement
-        top_contributors=[]  # TODO: Implement
-    )
+        league_rank=club.get("league_rank", 0)
+    ).model_dump_json(exclude_none=True)
+    return _cacheable_response(request, body, _STATS_CACHE_CONTROL)
 
 
 @router.post(
@@ -229,8 +269,12 @@ async def join_club(
             detail="User ID not found in authentication"
         )
 
-    # Update user's club_id
-    await repo.update_user(user_id, {"club_id": club_id})
+    # Update user's club_id and both clubs' member counts
+    old_club_id = current_user.get("club_id")
+    if old_club_id != club_id:
+        await repo.move_user_to_club(user_id, old_club_id, {"club_id": club_id})
+        await invalidate_cached_user(user_id)
+        await invalidate_clubs_cache(filter(None, (old_club_id, club_id)))
 
     logger.info(f"User {user_id} joined club {club_id}")
 
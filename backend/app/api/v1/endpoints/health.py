@@ -4,8 +4,11 @@ Health check endpoint.
 This module provides system health monitoring endpoints.
 """
 
+import asyncio
 from datetime import datetime
-from fastapi import APIRouter, Depends
+from typing import Optional
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, Response
 import redis.asyncio as aioredis
 
 from app.models.schemas import HealthCheckResponse
@@ -15,52 +18,72 @@ import app.dependencies as deps
 
 router = APIRouter(tags=["health"])
 
+# Last serialized /health body, reused to absorb frequent polling
+_health_cache: TTLCache = TTLCache(maxsize=1, ttl=5)
+_HEALTH_CACHE_KEY = "health"
 
-@router.get("/health", response_model=HealthCheckResponse)
+# Constant liveness body, serialized once
+_ALIVE_BODY = b'{"status":"alive"}'
+
+# Upper bound for each dependency probe so a hung service can't stall the check
+_PROBE_TIMEOUT = 0.25
+_READY_TIMEOUT = 0.5
+
+
+async def _check_firestore() -> str:
+    """Report whether the Firestore client is configured."""
+    return "healthy" if deps._db_client else "not_configured"
+
+
+async def _check_redis(redis: Optional[aioredis.Redis]) -> str:
+    """Ping Redis within the probe timeout."""
+    if not redis:
+        return "unavailable"
+    await asyncio.wait_for(redis.ping(), _PROBE_TIMEOUT)
+    return "healthy"
+
+
+@router.api_route("/health", methods=["GET", "HEAD"], response_model=HealthCheckResponse)
 async def health_check(
     redis: aioredis.Redis = Depends(get_redis_client)
-) -> HealthCheckResponse:
+) -> Response:
     """
     Health check endpoint.
 
-    Returns service status and component health.
+    Returns service status and component health. The result is reused
+    for a few seconds so probe storms don't hit the services.
 
     Returns:
-        HealthCheckResponse with status and service information
+        HealthCheckResponse JSON with status and service information
     """
-    services = {}
-
-    # Check Firestore (without raising exception)
-    try:
-        db = deps._db_client
-        if db:
-            # Try a simple operation to verify connection
-            services["firestore"] = "healthy"
-        else:
-            services["firestore"] = "not_configured"
-    except Exception as e:
-        services["firestore"] = f"error: {str(e)}"
-
-    # Check Redis
-    try:
-        if redis:
-            await redis.ping()
-            services["redis"] = "healthy"
-        else:
-            services["redis"] = "unavailable"
-    except Exception as e:
-        services["redis"] = f"error: {str(e)}"
+    body = _health_cache.get(_HEALTH_CACHE_KEY)
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+
+    # Probe services concurrently; failures and timeouts are reported, not raised
+    names = ("firestore", "redis")
+    results = await asyncio.gather(
+        asyncio.wait_for(_check_firestore(), _PROBE_TIMEOUT),
+        _check_redis(redis),
+        return_exceptions=True
+    )
+    services = {
+        name: f"error: {str(result) or type(result).__name__}" if isinstance(result, BaseException) else result
+        for name, result in zip(names, results)
+    }
 
     # Overall status (degraded if any service is not healthy, but still return 200)
     all_healthy = all(status == "healthy" for status in services.values())
     overall_status = "healthy" if all_healthy else "degraded"
 
-    return HealthCheckResponse(
+    body = HealthCheckResponse(
         status=overall_status,
         timestamp=datetime.now(),
         version=settings.VERSION,
         services=services
-    )
+    ).model_dump_json()
+    _health_cache[_HEALTH_CACHE_KEY] = body
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/health/ready")
@@ -81,8 +104,11 @@ async def readiness_check(
         if redis is None:
             return {"status": "not_ready", "reason": "redis unavailable"}
 
-        # Test Redis connection
-        await redis.ping()
+        # Test Redis connection (bounded so a slow Redis can't hang the probe)
+        try:
+            await asyncio.wait_for(redis.ping(), _READY_TIMEOUT)
+        except asyncio.TimeoutError:
+            return {"status": "not_ready", "reason": "redis timeout"}
 
         # Return ready even if Firestore is not configured (for development)
         if db is None:
@@ -93,12 +119,12 @@ async def readiness_check(
         return {"status": "not_ready", "reason": str(e)}
 
 
-@router.get("/health/live")
-async def liveness_check() -> dict:
+@router.api_route("/health/live", methods=["GET", "HEAD"])
+async def liveness_check() -> Response:
     """
     Kubernetes liveness probe endpoint.
 
     Returns:
         Simple alive status
     """
-    return {"status": "alive"}
+    return Response(content=_ALIVE_BODY, media_type="application/json")
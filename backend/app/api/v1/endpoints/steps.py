@@ -5,6 +5,7 @@ This module handles step data synchronization, history, and statistics.
 """
 
 import logging
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 
 from app.models.schemas import (
@@ -15,8 +16,7 @@ from app.models.schemas import (
     StepStatsResponse,
     ErrorResponse
 )
-from app.dependencies import get_firestore_repository, get_current_user
-from app.repositories.firestore_repo import FirestoreRepository
+from app.dependencies import get_step_service, get_current_user, invalidate_cached_user
 from app.services.step_service import StepService
 from app.utils.error_handlers import handle_exceptions
 
@@ -37,7 +37,7 @@ router = APIRouter(prefix="/steps", tags=["steps"])
 async def sync_steps(
     request: StepSyncRequest,
     current_user: dict = Depends(get_current_user),
-    repo: FirestoreRepository = Depends(get_firestore_repository)
+    step_service: StepService = Depends(get_step_service)
 ) -> StepSyncResponse:
     """
     Synchronize step data for the authenticated user.
@@ -52,7 +52,7 @@ async def sync_steps(
     Args:
         request: Step sync request data
         current_user: Authenticated user
-        repo: Firestore repository
+        step_service: Step service
 
     Returns:
         StepSyncResponse with points earned and totals
@@ -61,7 +61,6 @@ async def sync_steps(
         HTTPException: If sync fails
     """
     user_id = current_user["user_id"]
-    step_service = StepService(repo)
 
     result = await step_service.sync_steps(
         user_id=user_id,
@@ -70,8 +69,11 @@ async def sync_steps(
         source=request.source,
         device_signature=request.device_signature
     )
+    # User total_points changed
+    await invalidate_cached_user(user_id)
 
-    return StepSyncResponse(
+    # Values computed by the service; skip re-validation
+    return StepSyncResponse.model_construct(
         points_earned=result["points_earned"],
         total_points=result["total_points"],
         club_contribution=result["club_contribution"],
@@ -89,16 +91,20 @@ async def sync_steps(
 @handle_exceptions("Get step history")
 async def get_step_history(
     days: int = Query(default=30, ge=1, le=365, description="Number of days to retrieve"),
+    count_only: bool = Query(default=False, description="Return only total_records, with an empty history"),
+    before: Optional[str] = Query(default=None, description="Return records older than this date (YYYY-MM-DD), for paging"),
     current_user: dict = Depends(get_current_user),
-    repo: FirestoreRepository = Depends(get_firestore_repository)
+    step_service: StepService = Depends(get_step_service)
 ) -> StepHistoryResponse:
     """
     Get step history for the authenticated user.
 
     Args:
         days: Number of days to retrieve (1-365)
+        count_only: Skip building history items and return only the count
+        before: Paging cursor; pass the last date of the previous page
         current_user: Authenticated user
-        repo: Firestore repository
+        step_service: Step service
 
     Returns:
         StepHistoryResponse with step history
@@ -107,13 +113,19 @@ async def get_step_history(
         HTTPException: If retrieval fails
     """
     user_id = current_user["user_id"]
-    step_service = StepService(repo)
 
-    history = await step_service.get_user_history(user_id, days)
+    history = await step_service.get_user_history(user_id, days, before)
 
-    # Convert to StepHistoryItem objects
+    if count_only:
+        return StepHistoryResponse.model_construct(
+            user_id=user_id,
+            total_records=len(history),
+            history=[]
+        )
+
+    # Convert to StepHistoryItem objects (trusted Firestore data, skip validation)
     history_items = [
-        StepHistoryItem(
+        StepHistoryItem.model_construct(
             date=log.get("date", ""),
             steps=log.get("steps", 0),
             points=log.get("points", 0),
@@ -123,7 +135,7 @@ async def get_step_history(
         for log in history
     ]
 
-    return StepHistoryResponse(
+    return StepHistoryResponse.model_construct(
         user_id=user_id,
         total_records=len(history_items),
         history=history_items
@@ -140,7 +152,7 @@ async def get_step_history(
 @handle_exceptions("Get step stats")
 async def get_step_stats(
     current_user: dict = Depends(get_current_user),
-    repo: FirestoreRepository = Depends(get_firestore_repository)
+    step_service: StepService = Depends(get_step_service)
 ) -> StepStatsResponse:
     """
     Get step statistics for the authenticated user.
@@ -154,7 +166,7 @@ async def get_step_stats(
 
     Args:
         current_user: Authenticated user
-        repo: Firestore repository
+        step_service: Step service
 
     Returns:
         StepStatsResponse with user statistics
@@ -163,8 +175,7 @@ async def get_step_stats(
         HTTPException: If retrieval fails
     """
     user_id = current_user["user_id"]
-    step_service = StepService(repo)
 
     stats = await step_service.get_user_stats(user_id)
 
-    return StepStatsResponse(**stats)
+    return StepStatsResponse.model_construct(**stats)
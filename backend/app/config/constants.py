@@ -5,7 +5,8 @@
 バックエンドとモバイルアプリ間で整合性を保つため、定数はここで一元管理されます。
 """
 
-from typing import Set
+from types import MappingProxyType
+from typing import FrozenSet, Mapping
 
 # ============================================================================
 # クラブID定義 (Club IDs)
@@ -17,7 +18,7 @@ from typing import Set
 #   2. JSON/APIでの標準的な形式
 #   3. モバイル側との互換性
 
-VALID_CLUB_IDS: Set[str] = {
+VALID_CLUB_IDS: FrozenSet[str] = frozenset({
     "urawa-reds",
     "kashima-antlers",
     "yokohama-fmarinos",
@@ -30,10 +31,10 @@ VALID_CLUB_IDS: Set[str] = {
     "sanfrecce-hiroshima",
     "consadole-sapporo",
     "shimizu-spulse",
-}
+})
 
 # クラブ名（日本語表記）
-CLUB_NAMES = {
+CLUB_NAMES: Mapping[str, str] = MappingProxyType({
     "urawa-reds": "浦和レッズ",
     "kashima-antlers": "鹿島アントラーズ",
     "yokohama-fmarinos": "横浜F・マリノス",
@@ -46,13 +47,14 @@ CLUB_NAMES = {
     "sanfrecce-hiroshima": "サンフレッチェ広島",
     "consadole-sapporo": "北海道コンサドーレ札幌",
     "shimizu-spulse": "清水エスパルス",
-}
+})
 
 # ============================================================================
 # ポイント計算定数 (Point Calculation)
 # ============================================================================
 STEPS_PER_POINT = 1000  # 1000歩 = 1ポイント
 MAX_DAILY_STEPS = 100000  # 1日の最大歩数
+RECENT_STEPS_DAYS = 365  # ユーザーごとに保持する直近の歩数履歴（日数）
 
 # ============================================================================
 # ページネーション定数 (Pagination)
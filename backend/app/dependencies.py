@@ -4,16 +4,24 @@ Dependency injection for FastAPI endpoints.
 This module provides dependency functions for authentication, database access, and caching.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional
+import time
+from datetime import datetime
+from typing import Any, Iterable, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import firebase_admin
-from firebase_admin import credentials, firestore, auth as firebase_auth
+from firebase_admin import credentials, firestore, firestore_async, auth as firebase_auth
+import orjson
 import redis.asyncio as aioredis
+from cachetools import TTLCache
 
 from app.settings import settings
 from app.repositories.firestore_repo import FirestoreRepository
+from app.services.step_service import StepService
+from app.utils.security import decode_access_token
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +29,28 @@ logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
 # Global clients (initialized in main.py)
-_db_client: Optional[firestore.Client] = None
+_db_client: Optional[firestore.AsyncClient] = None
 _redis_client: Optional[aioredis.Redis] = None
 
+# In-process user document cache (keyed by user_id)
+_user_cache: TTLCache = TTLCache(maxsize=5000, ttl=30)
+
+# Shared Redis user document cache (key: user:{user_id})
+_USER_REDIS_TTL = 120
+_USER_DATETIME_FIELDS = ("created_at", "updated_at")
+
+# In-process cache of the serialized club list response
+_clubs_cache: TTLCache = TTLCache(maxsize=1, ttl=45)
+
+# Shared Redis cache of serialized club responses (keys: clubs:all:v1, clubs:{club_id}:v1)
+_REDIS_CLUBS_TTL = 60
+
+# Club cache key of the full club list response
+CLUB_LIST_KEY = "all"
+
+# Verified token cache: sha256(token) -> (user_id, expires_at)
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=5)
+
 
 def initialize_firebase() -> None:
     """
@@ -52,7 +79,7 @@ def initialize_firebase() -> None:
                 'projectId': settings.FIREBASE_PROJECT_ID,
             })
 
-    _db_client = firestore.client()
+    _db_client = firestore_async.client()
 
 
 async def initialize_redis() -> None:
@@ -79,6 +106,28 @@ async def initialize_redis() -> None:
         _redis_client = None
 
 
+async def warm_up_clients() -> None:
+    """
+    Open Firestore and Redis connections ahead of the first request.
+
+    Should be called once at application startup, after initialization.
+    Failures are logged and otherwise ignored.
+    """
+    if _db_client is not None:
+        try:
+            await _db_client.collection("clubs").limit(1).get()
+            logger.info("Firestore connection warmed up")
+        except Exception as e:
+            logger.warning(f"Firestore warm-up failed: {str(e)}")
+
+    if _redis_client is not None:
+        try:
+            await _redis_client.set("__warmup__", 1, ex=1)
+            logger.info("Redis connection warmed up")
+        except Exception as e:
+            logger.warning(f"Redis warm-up failed: {str(e)}")
+
+
 async def close_redis() -> None:
     """Close Redis connection."""
     global _redis_client
@@ -87,12 +136,12 @@ async def close_redis() -> None:
         logger.info("Redis connection closed")
 
 
-def get_firestore_client() -> firestore.Client:
+def get_firestore_client() -> firestore.AsyncClient:
     """
     Get Firestore client instance.
 
     Returns:
-        Firestore client
+        Async Firestore client
 
     Raises:
         HTTPException: If Firestore is not initialized
@@ -106,7 +155,7 @@ def get_firestore_client() -> firestore.Client:
 
 
 def get_firestore_repository(
-    db: firestore.Client = Depends(get_firestore_client)
+    db: firestore.AsyncClient = Depends(get_firestore_client)
 ) -> FirestoreRepository:
     """
     Get FirestoreRepository instance.
@@ -120,6 +169,21 @@ def get_firestore_repository(
     return FirestoreRepository(db)
 
 
+def get_step_service(
+    repo: FirestoreRepository = Depends(get_firestore_repository)
+) -> StepService:
+    """
+    Get StepService instance.
+
+    Args:
+        repo: Firestore repository (injected)
+
+    Returns:
+        StepService instance
+    """
+    return StepService(repo)
+
+
 async def get_redis_client() -> Optional[aioredis.Redis]:
     """
     Get Redis client instance.
@@ -130,47 +194,274 @@ async def get_redis_client() -> Optional[aioredis.Redis]:
     return _redis_client
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    repo: FirestoreRepository = Depends(get_firestore_repository)
-) -> dict:
+def _user_redis_key(user_id: str) -> str:
+    """Redis key for a cached user document."""
+    return f"user:{user_id}"
+
+
+def _json_default(value: Any) -> str:
+    """Encode values orjson cannot (e.g. Firestore timestamp subclasses) as strings."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _decode_user(raw: str) -> dict:
+    """Decode a Redis-cached user document, restoring timestamp fields."""
+    user = orjson.loads(raw)
+    for field in _USER_DATETIME_FIELDS:
+        if isinstance(user.get(field), str):
+            user[field] = datetime.fromisoformat(user[field])
+    return user
+
+
+async def _store_user(user_id: str, user: dict) -> None:
+    """Put a user document in the in-process cache and Redis."""
+    _user_cache[user_id] = user
+    if _redis_client is None:
+        return
+    try:
+        await _redis_client.setex(
+            _user_redis_key(user_id), _USER_REDIS_TTL, orjson.dumps(user, default=_json_default)
+        )
+    except Exception as e:
+        logger.warning(f"Redis user cache write failed for {user_id}: {str(e)}")
+
+
+async def get_cached_user(user_id: str) -> Optional[dict]:
     """
-    Get current authenticated user from Firebase ID token or JWT access token.
+    Get user data, serving repeated lookups from cache.
+
+    Checks the in-process cache, then Redis, and only touches Firestore
+    on a miss.
 
     Args:
-        credentials: HTTP bearer token credentials
-        repo: Firestore repository
+        user_id: User identifier
 
     Returns:
-        User data dictionary
+        User data dictionary or None if not found
+    """
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
 
-    Raises:
-        HTTPException: If authentication fails
+    if _redis_client is not None:
+        try:
+            raw = await _redis_client.get(_user_redis_key(user_id))
+            if raw is not None:
+                user = _decode_user(raw)
+                _user_cache[user_id] = user
+                return user
+        except Exception as e:
+            logger.warning(f"Redis user cache read failed for {user_id}: {str(e)}")
+
+    user = await FirestoreRepository(get_firestore_client()).get_user(user_id)
+    if user:
+        await _store_user(user_id, user)
+    return user
+
+
+async def cache_user(user_id: str, user: dict) -> None:
     """
-    token = credentials.credentials
+    Write a user's latest data through to the cache.
+
+    Use after a write whose resulting document is already known.
+
+    Args:
+        user_id: User identifier
+        user: Full user data (a "user_id" key, if present, is dropped)
+    """
+    await _store_user(user_id, {k: v for k, v in user.items() if k != "user_id"})
+
+
+async def invalidate_cached_user(user_id: str) -> None:
+    """
+    Evict a user from the cache.
+
+    Must be called after any write to the user document.
+
+    Args:
+        user_id: User identifier
+    """
+    _user_cache.pop(user_id, None)
+    if _redis_client is None:
+        return
+    try:
+        await _redis_client.delete(_user_redis_key(user_id))
+    except Exception as e:
+        logger.warning(f"Redis user cache delete failed for {user_id}: {str(e)}")
+
+
+def _club_redis_key(club_id: str) -> str:
+    """Redis key for a cached club response (CLUB_LIST_KEY for the full list)."""
+    return f"clubs:{club_id}:v1"
+
+
+async def get_cached_club_response(club_id: str) -> Optional[str]:
+    """
+    Get a cached serialized club response.
+
+    The full list is also cached in process; club details only in Redis.
+
+    Args:
+        club_id: Club identifier, or CLUB_LIST_KEY for the full list
+
+    Returns:
+        Serialized response body or None on a miss
+    """
+    if club_id == CLUB_LIST_KEY:
+        body = _clubs_cache.get(CLUB_LIST_KEY)
+        if body is not None:
+            return body
+
+    if _redis_client is None:
+        return None
+    try:
+        body = await _redis_client.get(_club_redis_key(club_id))
+    except Exception as e:
+        logger.warning(f"Redis club cache read failed for {club_id}: {str(e)}")
+        return None
+
+    if body is not None and club_id == CLUB_LIST_KEY:
+        _clubs_cache[CLUB_LIST_KEY] = body
+    return body
+
+
+async def cache_club_response(club_id: str, body: str) -> None:
+    """
+    Store a serialized club response in the cache.
+
+    Args:
+        club_id: Club identifier, or CLUB_LIST_KEY for the full list
+        body: Serialized response body
+    """
+    if club_id == CLUB_LIST_KEY:
+        _clubs_cache[CLUB_LIST_KEY] = body
+    if _redis_client is None:
+        return
+    try:
+        await _redis_client.setex(_club_redis_key(club_id), _REDIS_CLUBS_TTL, body)
+    except Exception as e:
+        logger.warning(f"Redis club cache write failed for {club_id}: {str(e)}")
+
+
+async def invalidate_clubs_cache(club_ids: Iterable[str] = ()) -> None:
+    """
+    Drop cached club responses. Call after any write to club documents.
+
+    Args:
+        club_ids: Clubs whose detail responses changed
+    """
+    _clubs_cache.pop(CLUB_LIST_KEY, None)
+    if _redis_client is None:
+        return
+    try:
+        await _redis_client.delete(
+            _club_redis_key(CLUB_LIST_KEY),
+            *(_club_redis_key(club_id) for club_id in club_ids)
+        )
+    except Exception as e:
+        logger.warning(f"Redis club cache invalidation failed: {str(e)}")
+
+
+def _token_redis_key(cache_key: bytes) -> str:
+    """Redis key for a verified token (first 16 hex chars of its SHA-256)."""
+    return f"idtok:{cache_key.hex()[:16]}"
+
+
+async def _verify_token(token: str) -> Optional[str]:
+    """
+    Resolve the user ID from a JWT access token or Firebase ID token.
+
+    Verified tokens are cached by SHA-256 digest, in process for a few
+    seconds and in Redis until the token's exp claim, to skip repeated
+    signature checks. Firebase verification runs off the event loop.
+
+    Args:
+        token: Bearer token string
+
+    Returns:
+        User ID, or None if the token is invalid
+    """
+    cache_key = hashlib.sha256(token.encode()).digest()
+    now = time.time()
+
+    cached = _token_cache.get(cache_key)
+    if cached and cached[1] > now:
+        return cached[0]
+
+    if _redis_client is not None:
+        try:
+            raw = await _redis_client.get(_token_redis_key(cache_key))
+            if raw is not None:
+                entry = orjson.loads(raw)
+                if entry["exp"] > now:
+                    _token_cache[cache_key] = (entry["uid"], entry["exp"])
+                    return entry["uid"]
+        except Exception as e:
+            logger.warning(f"Redis token cache read failed: {str(e)}")
+
     user_id = None
+    expires_at = None
 
     # Try JWT access token first (for custom auth)
     try:
-        from app.utils.security import decode_access_token
         decoded = decode_access_token(token)
         if decoded:
             user_id = decoded.get('sub')
+            expires_at = decoded.get('exp')
             logger.debug(f"JWT token decoded: user_id={user_id}")
     except Exception as e:
         logger.debug(f"JWT decode failed: {str(e)}")
 
-    # If JWT failed, try Firebase ID token
+    # If JWT failed, try Firebase ID token (blocking RSA check / JWKS fetch)
     if not user_id:
         try:
-            decoded_token = firebase_auth.verify_id_token(token)
+            decoded_token = await asyncio.to_thread(firebase_auth.verify_id_token, token)
             user_id = decoded_token.get('uid')
+            expires_at = decoded_token.get('exp')
             logger.debug(f"Firebase token verified: user_id={user_id}")
         except firebase_auth.InvalidIdTokenError:
             logger.debug("Firebase token verification failed")
         except Exception as e:
             logger.debug(f"Firebase token error: {str(e)}")
 
+    if user_id:
+        _token_cache[cache_key] = (user_id, expires_at or now + _token_cache.ttl)
+        if expires_at and _redis_client is not None:
+            try:
+                await _redis_client.setex(
+                    _token_redis_key(cache_key),
+                    max(int(expires_at - now), 1),
+                    orjson.dumps({"uid": user_id, "exp": expires_at})
+                )
+            except Exception as e:
+                logger.warning(f"Redis token cache write failed: {str(e)}")
+
+    return user_id
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> dict:
+    """
+    Get current authenticated user from Firebase ID token or JWT access token.
+
+    Does not acquire a repository; the user document is read from cache
+    and Firestore is only touched on a miss.
+
+    Args:
+        credentials: HTTP bearer token credentials
+
+    Returns:
+        User data dictionary
+
+    Raises:
+        HTTPException: If authentication fails
+    """
+    token = credentials.credentials
+    user_id = await _verify_token(token)
+
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -180,7 +471,7 @@ async def get_current_user(
 
     # Get user from database
     try:
-        user = await repo.get_user(user_id)
+        user = await get_cached_user(user_id)
 
         if not user:
             raise HTTPException(
@@ -188,8 +479,8 @@ async def get_current_user(
                 detail="User not found"
             )
 
-        user["user_id"] = user_id
-        return user
+        # Copy so handlers never mutate the cached document
+        return {**user, "user_id": user_id}
 
     except HTTPException:
         raise
@@ -203,8 +494,7 @@ async def get_current_user(
 
 
 async def get_current_user_optional(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    repo: FirestoreRepository = Depends(get_firestore_repository)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[dict]:
     """
     Get current user if authenticated, otherwise return None.
@@ -213,7 +503,6 @@ async def get_current_user_optional(
 
     Args:
         credentials: HTTP bearer token credentials (optional)
-        repo: Firestore repository
 
     Returns:
         User data dictionary or None
@@ -222,6 +511,6 @@ async def get_current_user_optional(
         return None
 
     try:
-        return await get_current_user(credentials, repo)
+        return await get_current_user(credentials)
     except HTTPException:
         return None
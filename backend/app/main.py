@@ -8,12 +8,13 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.settings import settings
 from app.api.v1.router import api_router
-from app.dependencies import initialize_firebase, initialize_redis, close_redis
+from app.dependencies import initialize_firebase, initialize_redis, warm_up_clients, close_redis
 from app.utils.error_handlers import AppError
+from app.utils.security import close_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -47,7 +48,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize Redis: {str(e)}")
 
-    logger.info("Application startup complete")
+    # Open connections now so the first request doesn't pay the handshake
+    await warm_up_clients()
+
+    logger.info(f"Application startup complete ({len(app.routes)} routes registered)")
 
     yield
 
@@ -60,6 +64,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error closing Redis: {str(e)}")
 
+    try:
+        await close_http_client()
+        logger.info("HTTP client closed")
+    except Exception as e:
+        logger.error(f"Error closing HTTP client: {str(e)}")
+
     logger.info("Application shutdown complete")
 
 
@@ -71,6 +81,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -88,7 +99,7 @@ app.add_middleware(
 @app.exception_handler(AppError)
 async def app_error_handler(request: Request, exc: AppError):
     """カスタムエラーのグローバルハンドラー"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "detail": exc.message,
@@ -100,7 +111,7 @@ async def app_error_handler(request: Request, exc: AppError):
 @app.exception_handler(404)
 async def not_found_handler(request, exc):
     """Handle 404 errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={
             "error": "Not Found",
@@ -113,7 +124,7 @@ async def not_found_handler(request, exc):
 async def internal_server_error_handler(request, exc):
     """Handle 500 errors."""
     logger.error(f"Internal server error: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal Server Error",
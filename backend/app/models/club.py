@@ -10,6 +10,17 @@ from typing import Optional
 class Club:
     """Club domain model representing a J-League football club."""
 
+    __slots__ = (
+        "club_id",
+        "name",
+        "founded_year",
+        "stadium",
+        "total_points",
+        "active_members",
+        "league_rank",
+        "logo_url",
+    )
+
     def __init__(
         self,
         club_id: str,
@@ -66,22 +77,16 @@ class Club:
         """
         Create Club instance from dictionary.
 
+        Keys that are not club fields are ignored; missing optional fields
+        fall back to the constructor defaults.
+
         Args:
             data: Dictionary containing club data
 
         Returns:
             Club instance
         """
-        return cls(
-            club_id=data["club_id"],
-            name=data["name"],
-            founded_year=data["founded_year"],
-            stadium=data["stadium"],
-            total_points=data.get("total_points", 0),
-            active_members=data.get("active_members", 0),
-            league_rank=data.get("league_rank", 0),
-            logo_url=data.get("logo_url"),
-        )
+        return cls(**{field: data[field] for field in cls.__slots__ if field in data})
 
     def add_points(self, points: int) -> None:
         """
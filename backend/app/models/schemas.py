@@ -8,6 +8,20 @@ from datetime import datetime
 from typing import Literal, Optional, List
 from pydantic import BaseModel, Field, EmailStr, field_validator
 
+from app.utils.validators import (
+    parse_and_validate_date,
+    validate_email,
+    validate_password_strength,
+)
+
+
+def _check_password_strength(v: str) -> str:
+    """Raise ValueError if the password fails validate_password_strength."""
+    is_valid, error_msg = validate_password_strength(v)
+    if not is_valid:
+        raise ValueError(error_msg)
+    return v
+
 
 # ========== Authentication Schemas ==========
 
@@ -22,20 +36,22 @@ class UserRegisterRequest(BaseModel):
     @classmethod
     def validate_password(cls, v: str) -> str:
         """Validate password strength."""
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _check_password_strength(v)
 
 
 class UserLoginRequest(BaseModel):
     """User login request schema."""
-    email: EmailStr
+    email: str
     password: str
 
+    @field_validator("email")
+    @classmethod
+    def check_email_format(cls, v: str) -> str:
+        """Shape-check the email; Firebase rejects unknown addresses anyway."""
+        if not validate_email(v):
+            raise ValueError("Invalid email address")
+        return v
+
 
 class UserLoginResponse(BaseModel):
     """User login response schema."""
@@ -79,13 +95,7 @@ class PasswordChangeRequest(BaseModel):
     @classmethod
     def validate_new_password(cls, v: str) -> str:
         """Validate new password strength."""
-        if not any(c.isupper() for c in v):
-            raise ValueError("Password must contain at least one uppercase letter")
-        if not any(c.islower() for c in v):
-            raise ValueError("Password must contain at least one lowercase letter")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Password must contain at least one digit")
-        return v
+        return _check_password_strength(v)
 
 
 # ========== Steps Schemas ==========
@@ -93,7 +103,7 @@ class PasswordChangeRequest(BaseModel):
 class StepSyncRequest(BaseModel):
     """Step data synchronization request schema."""
     steps: int = Field(ge=0, le=100000, description="Number of steps taken")
-    date: str = Field(pattern=r"^\d{4}-\d{2}-\d{2}$", description="Date in YYYY-MM-DD format")
+    date: str = Field(pattern=r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$", description="Date in YYYY-MM-DD format")
     source: Literal["healthkit", "googlefit"] = Field(description="Data source")
     device_signature: str = Field(min_length=1, max_length=200, description="Device identifier")
 
@@ -101,12 +111,7 @@ class StepSyncRequest(BaseModel):
     @classmethod
     def validate_date(cls, v: str) -> str:
         """Validate date format and ensure it's not in the future."""
-        try:
-            date_obj = datetime.strptime(v, "%Y-%m-%d")
-            if date_obj.date() > datetime.now().date():
-                raise ValueError("Date cannot be in the future")
-        except ValueError as e:
-            raise ValueError(f"Invalid date format: {str(e)}")
+        parse_and_validate_date(v)
         return v
 
 
@@ -174,11 +179,12 @@ class ClubStatsResponse(BaseModel):
     total_points: int
     total_steps: int
     active_members: int
-    weekly_points: int
-    monthly_points: int
     league_rank: int
-    weekly_rank: int
-    top_contributors: List[dict]
+    # Not implemented yet; omitted from responses while None
+    weekly_points: Optional[int] = None
+    monthly_points: Optional[int] = None
+    weekly_rank: Optional[int] = None
+    top_contributors: Optional[List[dict]] = None
 
 
 # ========== Health Check Schema ==========
@@ -4,13 +4,24 @@ User domain model.
 This module defines the User entity for the application.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 
 class User:
     """User domain model representing a registered user in the system."""
 
+    __slots__ = (
+        "user_id",
+        "email",
+        "nickname",
+        "club_id",
+        "total_points",
+        "total_steps",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
         self,
         user_id: str,
@@ -41,13 +52,16 @@ class User:
         self.club_id = club_id
         self.total_points = total_points
         self.total_steps = total_steps
-        self.created_at = created_at or datetime.now()
-        self.updated_at = updated_at or datetime.now()
+        now = datetime.now(timezone.utc)
+        self.created_at = created_at or now
+        self.updated_at = updated_at or now
 
     def to_dict(self) -> dict:
         """
         Convert User instance to dictionary.
 
+        Timestamps are left as datetime objects; orjson serializes them natively.
+
         Returns:
             Dictionary representation of the user
         """
@@ -58,8 +72,8 @@ class User:
             "club_id": self.club_id,
             "total_points": self.total_points,
             "total_steps": self.total_steps,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     @classmethod
@@ -67,30 +81,21 @@ class User:
         """
         Create User instance from dictionary.
 
+        Keys that are not user fields are ignored; missing optional fields
+        fall back to the constructor defaults. ISO-format timestamp strings
+        are parsed, while Firestore datetimes are used as-is.
+
         Args:
             data: Dictionary containing user data
 
         Returns:
             User instance
         """
-        created_at = data.get("created_at")
-        updated_at = data.get("updated_at")
-
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
-
-        return cls(
-            user_id=data["user_id"],
-            email=data["email"],
-            nickname=data["nickname"],
-            club_id=data["club_id"],
-            total_points=data.get("total_points", 0),
-            total_steps=data.get("total_steps", 0),
-            created_at=created_at,
-            updated_at=updated_at,
-        )
+        fields = {field: data[field] for field in cls.__slots__ if field in data}
+        for field in ("created_at", "updated_at"):
+            if isinstance(fields.get(field), str):
+                fields[field] = datetime.fromisoformat(fields[field])
+        return cls(**fields)
 
     def add_points(self, points: int) -> None:
         """
@@ -100,7 +105,7 @@ class User:
             points: Number of points to add
         """
         self.total_points += points
-        self.updated_at = datetime.now()
+        self.updated_at = datetime.now(timezone.utc)
 
     def add_steps(self, steps: int) -> None:
         """
@@ -110,7 +115,7 @@ class User:
             steps: Number of steps to add
         """
         self.total_steps += steps
-        self.updated_at = datetime.now()
+        self.updated_at = datetime.now(timezone.utc)
 
     def __repr__(self) -> str:
         """String representation of User."""
@@ -5,45 +5,175 @@ This module provides an abstraction layer for Firestore database operations.
 """
 
 import logging
-from datetime import datetime
-from typing import Optional, List, Dict, Any
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
+from google.api_core.exceptions import NotFound
 from google.cloud import firestore
-from google.cloud.firestore_v1.base_query import FieldFilter
+from google.cloud.firestore_v1.base_query import FieldFilter, Or
+
+from app.config.constants import RECENT_STEPS_DAYS
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _document_ref(
+    db: firestore.AsyncClient,
+    collection: str,
+    doc_id: str
+) -> firestore.AsyncDocumentReference:
+    """
+    Build a DocumentReference, reusing it for hot IDs (clubs, active users).
+
+    Keyed on the client too, so a re-initialized client gets fresh references.
+    """
+    return db.collection(collection).document(doc_id)
+
+
+# Step log fields copied into the per-user recent history summary
+_RECENT_STEPS_FIELDS = ("date", "steps", "points", "source", "created_at")
+
+
+def _recent_steps_entry(log: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a step log onto the fields kept in the recent history summary."""
+    return {field: log.get(field) for field in _RECENT_STEPS_FIELDS}
+
+
+def _plan_recent_steps(
+    entry: Dict[str, Any],
+    recent: List[Dict[str, Any]],
+    complete: bool
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Work out how a new entry changes the recent history summary.
+
+    The summary keeps the newest RECENT_STEPS_DAYS entries by date.
+
+    Args:
+        entry: Summary entry for the step log being saved
+        recent: Current summary entries, or the step history to backfill
+            from when the summary is not complete
+        complete: Whether recent is the summary's full contents
+
+    Returns:
+        Tuple of (entries to add, entries to remove)
+    """
+    ranked = sorted([entry, *recent], key=lambda x: x.get("date", ""), reverse=True)
+    kept, dropped = ranked[:RECENT_STEPS_DAYS], ranked[RECENT_STEPS_DAYS:]
+    if not complete:
+        # Backfill: nothing beyond the window was ever written to the summary
+        return kept, []
+    added = [e for e in kept if e is entry]
+    return added, [e for e in dropped if e is not entry]
+
+
+@firestore.async_transactional
+async def _create_user_txn(
+    transaction: firestore.AsyncTransaction,
+    user_ref: firestore.AsyncDocumentReference,
+    club_ref: firestore.AsyncDocumentReference,
+    data: Dict[str, Any]
+) -> None:
+    """Write a user document and bump its club's active_members atomically."""
+    if not (await club_ref.get(transaction=transaction)).exists:
+        raise NotFound(f"Club {club_ref.id} not found")
+    transaction.create(user_ref, data)
+    transaction.update(club_ref, {"active_members": firestore.Increment(1)})
+
+
+@firestore.async_transactional
+async def _move_user_txn(
+    transaction: firestore.AsyncTransaction,
+    user_ref: firestore.AsyncDocumentReference,
+    old_club_ref: Optional[firestore.AsyncDocumentReference],
+    new_club_ref: firestore.AsyncDocumentReference,
+    data: Dict[str, Any]
+) -> None:
+    """
+    Update a user's club and move one active member between clubs atomically.
+
+    A missing old club (legacy IDs) is skipped, and its counter never drops below zero.
+    """
+    if not (await new_club_ref.get(transaction=transaction)).exists:
+        raise NotFound(f"Club {new_club_ref.id} not found")
+
+    old_members = 0
+    if old_club_ref is not None:
+        old_club = await old_club_ref.get(transaction=transaction)
+        if old_club.exists:
+            old_members = (old_club.to_dict() or {}).get("active_members", 0)
+
+    transaction.update(user_ref, data)
+    if old_members > 0:
+        transaction.update(old_club_ref, {"active_members": firestore.Increment(-1)})
+    transaction.update(new_club_ref, {"active_members": firestore.Increment(1)})
+
+
 class FirestoreRepository:
     """Repository for managing Firestore database operations."""
 
-    def __init__(self, db: firestore.Client):
+    def __init__(self, db: firestore.AsyncClient):
         """
         Initialize FirestoreRepository.
 
         Args:
-            db: Firestore client instance
+            db: Async Firestore client instance
         """
         self.db = db
         self.users_collection = "users"
         self.clubs_collection = "clubs"
         self.steps_collection = "steps"
         self.step_logs_subcollection = "step_logs"
+        self.step_summaries_collection = "step_summaries"
+
+    def user_ref(self, user_id: str) -> firestore.AsyncDocumentReference:
+        """Get the (cached) reference to a user document."""
+        return _document_ref(self.db, self.users_collection, user_id)
+
+    def club_ref(self, club_id: str) -> firestore.AsyncDocumentReference:
+        """Get the (cached) reference to a club document."""
+        return _document_ref(self.db, self.clubs_collection, club_id)
+
+    def step_log_ref(self, user_id: str, date: str) -> firestore.AsyncDocumentReference:
+        """Get the reference to a user's step log for a date."""
+        # Date is part of the document ID for easy duplicate checking
+        return self.db.collection(self.steps_collection).document(f"{user_id}_{date}")
 
     # ========== User Operations ==========
 
-    async def create_user(self, user_id: str, data: Dict[str, Any]) -> None:
+    async def create_user_and_bump_club(
+        self,
+        user_id: str,
+        data: Dict[str, Any],
+        club_id: str
+    ) -> None:
         """
-        Create a new user document.
+        Create a new user document and increment the club's member count.
+
+        Runs as a single transaction that also verifies the club exists.
 
         Args:
             user_id: Unique user identifier
             data: User data dictionary
+            club_id: Club the user joins
+
+        Raises:
+            NotFound: If the club document does not exist
+            AlreadyExists: If a user document with this ID already exists
         """
         try:
-            data["created_at"] = datetime.now()
-            data["updated_at"] = datetime.now()
-            self.db.collection(self.users_collection).document(user_id).set(data)
-            logger.info(f"Created user: {user_id}")
+            now = datetime.now(timezone.utc)
+            data["created_at"] = now
+            data["updated_at"] = now
+
+            await _create_user_txn(
+                self.db.transaction(),
+                self.user_ref(user_id),
+                self.club_ref(club_id),
+                data
+            )
+            logger.info(f"Created user: {user_id} (club {club_id})")
         except Exception as e:
             logger.error(f"Error creating user {user_id}: {str(e)}")
             raise
@@ -59,7 +189,7 @@ class FirestoreRepository:
             User data dictionary or None if not found
         """
         try:
-            doc = self.db.collection(self.users_collection).document(user_id).get()
+            doc = await self.user_ref(user_id).get()
             if doc.exists:
                 return doc.to_dict()
             return None
@@ -80,9 +210,7 @@ class FirestoreRepository:
         try:
             users_ref = self.db.collection(self.users_collection)
             query = users_ref.where(filter=FieldFilter("email", "==", email)).limit(1)
-            docs = query.stream()
-
-            for doc in docs:
+            async for doc in query.stream():
                 data = doc.to_dict()
                 data["user_id"] = doc.id
                 return data
@@ -101,30 +229,47 @@ class FirestoreRepository:
             data: Updated user data
         """
         try:
-            data["updated_at"] = datetime.now()
-            self.db.collection(self.users_collection).document(user_id).update(data)
+            data["updated_at"] = datetime.now(timezone.utc)
+            await self.user_ref(user_id).update(data)
             logger.info(f"Updated user: {user_id}")
         except Exception as e:
             logger.error(f"Error updating user {user_id}: {str(e)}")
             raise
 
-    async def increment_user_points(self, user_id: str, points: int) -> None:
+    async def move_user_to_club(
+        self,
+        user_id: str,
+        old_club_id: Optional[str],
+        data: Dict[str, Any]
+    ) -> None:
         """
-        Increment user's total points atomically.
+        Update a user whose club changes and keep both clubs' active_members in sync.
+
+        The user update and both counter changes run in one transaction.
+        The old club's counter is left alone if that club document is
+        missing or its counter is already zero.
 
         Args:
             user_id: User identifier
-            points: Points to add
+            old_club_id: Club the user is leaving (None if none)
+            data: Updated user data, including the new "club_id"
+
+        Raises:
+            NotFound: If the new club document does not exist
         """
+        new_club_id = data["club_id"]
         try:
-            user_ref = self.db.collection(self.users_collection).document(user_id)
-            user_ref.update({
-                "total_points": firestore.Increment(points),
-                "updated_at": datetime.now()
-            })
-            logger.info(f"Incremented {points} points for user {user_id}")
+            data["updated_at"] = datetime.now(timezone.utc)
+            await _move_user_txn(
+                self.db.transaction(),
+                self.user_ref(user_id),
+                self.club_ref(old_club_id) if old_club_id else None,
+                self.club_ref(new_club_id),
+                data
+            )
+            logger.info(f"Moved user {user_id} from club {old_club_id} to {new_club_id}")
         except Exception as e:
-            logger.error(f"Error incrementing points for user {user_id}: {str(e)}")
+            logger.error(f"Error moving user {user_id} to club {new_club_id}: {str(e)}")
             raise
 
     # ========== Club Operations ==========
@@ -140,7 +285,7 @@ class FirestoreRepository:
             Club data dictionary or None if not found
         """
         try:
-            doc = self.db.collection(self.clubs_collection).document(club_id).get()
+            doc = await self.club_ref(club_id).get()
             if doc.exists:
                 return doc.to_dict()
             return None
@@ -150,15 +295,18 @@ class FirestoreRepository:
 
     async def get_all_clubs(self) -> List[Dict[str, Any]]:
         """
-        Retrieve all clubs.
+        Retrieve all clubs ordered by total points descending.
 
         Returns:
             List of club data dictionaries
         """
         try:
             clubs = []
-            docs = self.db.collection(self.clubs_collection).stream()
-            for doc in docs:
+            query = (
+                self.db.collection(self.clubs_collection)
+                .order_by("total_points", direction=firestore.Query.DESCENDING)
+            )
+            async for doc in query.stream():
                 club_data = doc.to_dict()
                 club_data["club_id"] = doc.id
                 clubs.append(club_data)
@@ -176,35 +324,18 @@ class FirestoreRepository:
             data: Updated club data
         """
         try:
-            self.db.collection(self.clubs_collection).document(club_id).update(data)
+            await self.club_ref(club_id).update(data)
             logger.info(f"Updated club: {club_id}")
         except Exception as e:
             logger.error(f"Error updating club {club_id}: {str(e)}")
             raise
 
-    async def increment_club_points(self, club_id: str, points: int) -> None:
-        """
-        Increment club's total points atomically.
-
-        Args:
-            club_id: Club identifier
-            points: Points to add
-        """
-        try:
-            club_ref = self.db.collection(self.clubs_collection).document(club_id)
-            club_ref.update({
-                "total_points": firestore.Increment(points)
-            })
-            logger.info(f"Incremented {points} points for club {club_id}")
-        except Exception as e:
-            logger.error(f"Error incrementing points for club {club_id}: {str(e)}")
-            raise
-
     # ========== Step Log Operations ==========
 
     async def save_step_log(
         self,
         user_id: str,
+        club_id: Optional[str],
         date: str,
         steps: int,
         points: int,
@@ -212,17 +343,31 @@ class FirestoreRepository:
         device_signature: str
     ) -> None:
         """
-        Save step log for a user.
+        Save step log for a user and credit the points.
+
+        The step log, the user's recent history summary, and the user and
+        club point totals are written in a single batch. The step log is
+        created rather than set, so a concurrent sync for the same date
+        fails the whole batch instead of crediting points twice.
+
+        The summary is kept to the newest RECENT_STEPS_DAYS entries here,
+        and built from the step logs on the first sync that finds it
+        incomplete, so reading history never writes.
 
         Args:
             user_id: User identifier
+            club_id: User's club identifier (None if not in a club)
             date: Date string (YYYY-MM-DD)
             steps: Number of steps
             points: Points earned
             source: Data source (healthkit/googlefit)
             device_signature: Device identifier
+
+        Raises:
+            AlreadyExists: If a step log for this date already exists
         """
         try:
+            now = datetime.now(timezone.utc)
             log_data = {
                 "user_id": user_id,
                 "date": date,
@@ -230,31 +375,55 @@ class FirestoreRepository:
                 "points": points,
                 "source": source,
                 "device_signature": device_signature,
-                "created_at": datetime.now()
+                "created_at": now
             }
 
-            # Use date as document ID for easy duplicate checking
-            doc_id = f"{user_id}_{date}"
-            self.db.collection(self.steps_collection).document(doc_id).set(log_data)
-            logger.info(f"Saved step log for user {user_id} on {date}")
+            summary = await self.get_step_summary(user_id)
+            complete = bool(summary and summary.get("complete"))
+            if complete:
+                recent = summary.get("recent_steps", [])
+            else:
+                history = await self.get_user_step_history(user_id, limit=RECENT_STEPS_DAYS)
+                recent = [_recent_steps_entry(log) for log in history]
+            added, stale = _plan_recent_steps(_recent_steps_entry(log_data), recent, complete)
+
+            summary_ref = self.db.collection(self.step_summaries_collection).document(user_id)
+            summary_data: Dict[str, Any] = {"complete": True}
+            if added:
+                summary_data["recent_steps"] = firestore.ArrayUnion(added)
+
+            batch = self.db.batch()
+            batch.create(self.step_log_ref(user_id, date), log_data)
+            batch.set(summary_ref, summary_data, merge=True)
+            if stale:
+                batch.update(summary_ref, {"recent_steps": firestore.ArrayRemove(stale)})
+            batch.update(self.user_ref(user_id), {
+                "total_points": firestore.Increment(points),
+                "updated_at": now
+            })
+            if club_id:
+                batch.update(self.club_ref(club_id), {
+                    "total_points": firestore.Increment(points)
+                })
+            await batch.commit()
+            logger.info(f"Saved step log for user {user_id} on {date} (+{points} points)")
         except Exception as e:
             logger.error(f"Error saving step log for user {user_id}: {str(e)}")
             raise
 
     async def get_step_log(self, user_id: str, date: str) -> Optional[Dict[str, Any]]:
         """
-        Get step log for a specific date.
+        Retrieve a user's step log for a date.
 
         Args:
             user_id: User identifier
             date: Date string (YYYY-MM-DD)
 
         Returns:
-            Step log data or None if not found
+            Step log dictionary or None if not found
         """
         try:
-            doc_id = f"{user_id}_{date}"
-            doc = self.db.collection(self.steps_collection).document(doc_id).get()
+            doc = await self.step_log_ref(user_id, date).get()
             if doc.exists:
                 return doc.to_dict()
             return None
@@ -265,14 +434,17 @@ class FirestoreRepository:
     async def get_user_step_history(
         self,
         user_id: str,
-        limit: int = 30
+        limit: int = 30,
+        after_date: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get user's step history.
+        Get user's step history, newest first.
 
         Args:
             user_id: User identifier
             limit: Maximum number of records to return
+            after_date: Cursor; only return records older than this date
+                (YYYY-MM-DD), e.g. the last date of the previous page
 
         Returns:
             List of step log dictionaries
@@ -283,19 +455,36 @@ class FirestoreRepository:
                 steps_ref
                 .where(filter=FieldFilter("user_id", "==", user_id))
                 .order_by("date", direction=firestore.Query.DESCENDING)
-                .limit(limit)
             )
+            if after_date:
+                # Server-side cursor, so later pages don't rescan earlier ones
+                query = query.start_after({"date": after_date})
+            query = query.limit(limit)
 
-            history = []
-            docs = query.stream()
-            for doc in docs:
-                history.append(doc.to_dict())
-
-            return history
+            return [doc.to_dict() async for doc in query.stream()]
         except Exception as e:
             logger.error(f"Error getting step history for user {user_id}: {str(e)}")
             raise
 
+    async def get_step_summary(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the user's recent step history summary document.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Summary dictionary (with "recent_steps" and "complete") or None
+        """
+        try:
+            doc = await self.db.collection(self.step_summaries_collection).document(user_id).get()
+            if doc.exists:
+                return doc.to_dict()
+            return None
+        except Exception as e:
+            logger.error(f"Error getting step summary for user {user_id}: {str(e)}")
+            raise
+
     async def get_club_members_count(self, club_id: str) -> int:
         """
         Get count of active members for a club.
@@ -309,8 +498,9 @@ class FirestoreRepository:
         try:
             users_ref = self.db.collection(self.users_collection)
             query = users_ref.where(filter=FieldFilter("club_id", "==", club_id))
-            docs = list(query.stream())
-            return len(docs)
+            # Server-side aggregation; no user documents are transferred
+            result = await query.count().get()
+            return int(result[0][0].value)
         except Exception as e:
             logger.error(f"Error getting member count for club {club_id}: {str(e)}")
             raise
@@ -336,8 +526,7 @@ class FirestoreRepository:
                 query = players_ref
 
             players = []
-            docs = query.stream()
-            for doc in docs:
+            async for doc in query.stream():
                 player_data = doc.to_dict()
                 player_data["player_id"] = doc.id
                 players.append(player_data)
@@ -358,7 +547,7 @@ class FirestoreRepository:
             Player data dictionary or None if not found
         """
         try:
-            doc = self.db.collection("players").document(player_id).get()
+            doc = await self.db.collection("players").document(player_id).get()
             if doc.exists:
                 player_data = doc.to_dict()
                 player_data["player_id"] = doc.id
@@ -396,42 +585,18 @@ class FirestoreRepository:
 
             if club_id:
                 # Match where club is either home or away
-                # Note: Firestore doesn't support OR queries directly,
-                # so we need to fetch both and merge
-                home_query = query.where(filter=FieldFilter("home_club_id", "==", club_id)).limit(limit)
-                away_query = query.where(filter=FieldFilter("away_club_id", "==", club_id)).limit(limit)
-
-                matches = []
-                match_ids = set()
-
-                # Get matches where club is home
-                for doc in home_query.stream():
-                    if doc.id not in match_ids:
-                        match_data = doc.to_dict()
-                        match_data["match_id"] = doc.id
-                        matches.append(match_data)
-                        match_ids.add(doc.id)
-
-                # Get matches where club is away
-                for doc in away_query.stream():
-                    if doc.id not in match_ids:
-                        match_data = doc.to_dict()
-                        match_data["match_id"] = doc.id
-                        matches.append(match_data)
-                        match_ids.add(doc.id)
-
-                # Sort by date descending
-                matches.sort(key=lambda x: x.get("date", ""), reverse=True)
-                return matches[:limit]
-            else:
-                # No club filter, just get all matches
-                query = query.order_by("date", direction=firestore.Query.DESCENDING).limit(limit)
-                matches = []
-                for doc in query.stream():
-                    match_data = doc.to_dict()
-                    match_data["match_id"] = doc.id
-                    matches.append(match_data)
-                return matches
+                query = query.where(filter=Or([
+                    FieldFilter("home_club_id", "==", club_id),
+                    FieldFilter("away_club_id", "==", club_id)
+                ]))
+
+            query = query.order_by("date", direction=firestore.Query.DESCENDING).limit(limit)
+            matches = []
+            async for doc in query.stream():
+                match_data = doc.to_dict()
+                match_data["match_id"] = doc.id
+                matches.append(match_data)
+            return matches
 
         except Exception as e:
             logger.error(f"Error getting matches: {str(e)}")
@@ -448,7 +613,7 @@ class FirestoreRepository:
             Match data dictionary or None if not found
         """
         try:
-            doc = self.db.collection("matches").document(match_id).get()
+            doc = await self.db.collection("matches").document(match_id).get()
             if doc.exists:
                 match_data = doc.to_dict()
                 match_data["match_id"] = doc.id
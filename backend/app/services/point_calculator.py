@@ -5,11 +5,26 @@ This module handles the conversion of steps to points and related calculations.
 """
 
 import logging
+from functools import lru_cache
 from app.config.constants import STEPS_PER_POINT, MAX_DAILY_STEPS
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _contribution_message(points: int) -> str:
+    """Contribution message for a point amount (daily points are capped, so this stays small)."""
+    if points == 0:
+        return "Every step counts! Keep walking for your club!"
+
+    if points >= 10:
+        return f"Amazing! You've earned {points} points for your club!"
+    elif points >= 5:
+        return f"Great job! {points} points added to your club's total!"
+    else:
+        return f"Nice work! {points} points contributed to your club!"
+
+
 class PointCalculator:
     """Service for calculating points from steps and managing point-related logic."""
 
@@ -45,7 +60,8 @@ class PointCalculator:
             return 0
 
         points = steps // self.steps_per_point
-        logger.info(f"Calculated {points} points from {steps} steps")
+        # Lazy %-formatting: this runs on every sync and INFO is off in production
+        logger.info("Calculated %d points from %d steps", points, steps)
         return points
 
     def calculate_steps_for_next_point(self, current_steps: int) -> int:
@@ -94,26 +110,17 @@ class PointCalculator:
         logger.info(f"Calculated {bonus} bonus points for {steps} steps")
         return bonus
 
-    def calculate_club_contribution(self, points: int, club_total_points: int) -> str:
+    def calculate_club_contribution(self, points: int) -> str:
         """
         Generate a contribution message based on points earned.
 
         Args:
             points: Points earned in this sync
-            club_total_points: Club's total points
 
         Returns:
             Encouragement message string
         """
-        if points == 0:
-            return "Every step counts! Keep walking for your club!"
-
-        if points >= 10:
-            return f"Amazing! You've earned {points} points for your club!"
-        elif points >= 5:
-            return f"Great job! {points} points added to your club's total!"
-        else:
-            return f"Nice work! {points} points contributed to your club!"
+        return _contribution_message(points)
 
     def validate_daily_limit(self, steps: int) -> bool:
         """
@@ -5,12 +5,15 @@ This module manages step synchronization, validation, and statistics.
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 from typing import Dict, Any, List, Optional
 
+from google.api_core.exceptions import AlreadyExists
+
+from app.config.constants import RECENT_STEPS_DAYS
 from app.repositories.firestore_repo import FirestoreRepository
 from app.services.point_calculator import PointCalculator
-from app.utils.validators import validate_steps, validate_date_format, validate_date_not_future
+from app.utils.validators import validate_steps, validate_date_format, parse_and_validate_date
 
 logger = logging.getLogger(__name__)
 
@@ -41,10 +44,9 @@ class StepService:
 
         This method:
         1. Validates the step data
-        2. Checks for duplicates
-        3. Calculates points
-        4. Saves to Firestore
-        5. Updates user and club totals
+        2. Calculates points
+        3. Saves the log and updates user and club totals in one batch;
+           the batch fails on an existing log, which marks a duplicate
 
         Args:
             user_id: User identifier
@@ -63,64 +65,41 @@ class StepService:
         if not validate_steps(steps):
             raise ValueError(f"Invalid steps count: {steps}")
 
-        if not validate_date_format(date):
-            raise ValueError(f"Invalid date format: {date}")
-
-        if not validate_date_not_future(date):
-            raise ValueError("Date cannot be in the future")
-
-        # 2. Check for duplicate
-        existing_log = await self.repository.get_step_log(user_id, date)
-        if existing_log:
-            logger.info(f"Step log already exists for user {user_id} on {date}")
-            # Return existing data instead of raising error
-            user = await self.repository.get_user(user_id)
-            return {
-                "points_earned": existing_log.get("points", 0),
-                "total_points": user.get("total_points", 0) if user else 0,
-                "club_contribution": "Data already synced for this date",
-                "is_verified": True,
-                "is_duplicate": True
-            }
+        parse_and_validate_date(date)
 
-        # 3. Calculate points
-        points = self.point_calculator.calculate_points(steps)
-        logger.info(f"Calculated {points} points from {steps} steps")
-
-        # 4. Save step log
-        await self.repository.save_step_log(
-            user_id=user_id,
-            date=date,
-            steps=steps,
-            points=points,
-            source=source,
-            device_signature=device_signature
-        )
-
-        # 5. Update user points
-        await self.repository.increment_user_points(user_id, points)
-
-        # 6. Get user data to find club
+        # 2. Get the user (duplicates are detected by the write in step 5)
         user = await self.repository.get_user(user_id)
         if not user:
             raise ValueError(f"User {user_id} not found")
 
+        # 3. Calculate points
+        points = self.point_calculator.calculate_points(steps)
+
+        # 4. Find the user's club
         club_id = user.get("club_id")
 
-        # 7. Update club points
-        if club_id:
-            await self.repository.increment_club_points(club_id, points)
+        # 5. Save step log and credit user and club points in one batch
+        try:
+            await self.repository.save_step_log(
+                user_id=user_id,
+                club_id=club_id,
+                date=date,
+                steps=steps,
+                points=points,
+                source=source,
+                device_signature=device_signature
+            )
+        except AlreadyExists:
+            # The batch failed as a whole, so the user's total is unchanged
+            logger.info(f"Step log already exists for user {user_id} on {date}")
+            existing_log = await self.repository.get_step_log(user_id, date)
+            return self._duplicate_result(existing_log or {}, user)
 
-        # 8. Get updated user data
-        updated_user = await self.repository.get_user(user_id)
-        total_points = updated_user.get("total_points", 0) if updated_user else 0
+        # 6. Increments are applied server-side, so derive the new total locally
+        total_points = user.get("total_points", 0) + points
 
-        # 9. Generate contribution message
-        club = await self.repository.get_club(club_id) if club_id else None
-        club_total = club.get("total_points", 0) if club else 0
-        contribution_message = self.point_calculator.calculate_club_contribution(
-            points, club_total
-        )
+        # 7. Generate contribution message
+        contribution_message = self.point_calculator.calculate_club_contribution(points)
 
         return {
             "points_earned": points,
@@ -130,23 +109,50 @@ class StepService:
             "is_duplicate": False
         }
 
+    @staticmethod
+    def _duplicate_result(
+        existing_log: Dict[str, Any],
+        user: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the sync result for a date that was already synced."""
+        # Return existing data instead of raising error
+        return {
+            "points_earned": existing_log.get("points", 0),
+            "total_points": user.get("total_points", 0),
+            "club_contribution": "Data already synced for this date",
+            "is_verified": True,
+            "is_duplicate": True
+        }
+
     async def get_user_history(
         self,
         user_id: str,
-        days: int = 30
+        days: int = 30,
+        before: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Get user's step history.
 
+        The first page is served from the summary document; older pages
+        are read from step logs with a query cursor.
+
         Args:
             user_id: User identifier
             days: Number of days to retrieve (default 30)
+            before: Only return records older than this date (YYYY-MM-DD)
 
         Returns:
             List of step history records
+
+        Raises:
+            ValueError: If before is not a valid date
         """
-        history = await self.repository.get_user_step_history(user_id, limit=days)
-        return history
+        if before is None:
+            return await self._get_recent_history(user_id, days)
+
+        if not validate_date_format(before):
+            raise ValueError(f"Invalid date format: {before}")
+        return await self.repository.get_user_step_history(user_id, limit=days, after_date=before)
 
     async def get_user_stats(self, user_id: str) -> Dict[str, Any]:
         """
@@ -164,7 +170,7 @@ class StepService:
             raise ValueError(f"User {user_id} not found")
 
         # Get step history
-        history = await self.repository.get_user_step_history(user_id, limit=365)
+        history = await self._get_recent_history(user_id, RECENT_STEPS_DAYS)
 
         if not history:
             return {
@@ -178,15 +184,21 @@ class StepService:
                 "longest_streak": 0
             }
 
-        # Calculate statistics
-        total_steps = sum(log.get("steps", 0) for log in history)
-        max_steps = max(log.get("steps", 0) for log in history)
+        # Calculate statistics in a single pass
+        total_steps = 0
+        max_steps = 0
+        for log in history:
+            steps = log.get("steps", 0)
+            total_steps += steps
+            if steps > max_steps:
+                max_steps = steps
         active_days = len(history)
         average_steps = total_steps / active_days if active_days > 0 else 0.0
 
-        # Calculate streaks
-        current_streak = self._calculate_current_streak(history)
-        longest_streak = self._calculate_longest_streak(history)
+        # Calculate streaks (parse each log date once)
+        dates = [date.fromisoformat(log["date"]) for log in history if log.get("date")]
+        current_streak = self._calculate_current_streak(dates)
+        longest_streak = self._calculate_longest_streak(dates)
 
         return {
             "user_id": user_id,
@@ -199,29 +211,46 @@ class StepService:
             "longest_streak": longest_streak
         }
 
-    def _calculate_current_streak(self, history: List[Dict[str, Any]]) -> int:
+    async def _get_recent_history(self, user_id: str, limit: int) -> List[Dict[str, Any]]:
         """
-        Calculate current consecutive days streak.
+        Get recent step logs, newest first, from the user's summary document.
+
+        Falls back to querying the step logs when the summary has not been
+        built yet; the summary is maintained by save_step_log, never here.
 
         Args:
-            history: List of step logs ordered by date descending
+            user_id: User identifier
+            limit: Maximum number of records (at most RECENT_STEPS_DAYS)
 
         Returns:
-            Current streak count
+            List of step logs ordered by date descending
         """
-        if not history:
-            return 0
+        summary = await self.repository.get_step_summary(user_id)
 
-        streak = 0
-        expected_date = datetime.now().date()
+        if summary and summary.get("complete"):
+            recent = sorted(
+                summary.get("recent_steps", []),
+                key=lambda x: x.get("date", ""),
+                reverse=True
+            )
+            return recent[:limit]
 
-        for log in history:
-            log_date_str = log.get("date")
-            if not log_date_str:
-                continue
+        return await self.repository.get_user_step_history(user_id, limit=limit)
+
+    def _calculate_current_streak(self, dates: List[date]) -> int:
+        """
+        Calculate current consecutive days streak.
 
-            log_date = datetime.strptime(log_date_str, "%Y-%m-%d").date()
+        Args:
+            dates: Logged dates ordered descending
 
+        Returns:
+            Current streak count
+        """
+        streak = 0
+        expected_date = date.today()
+
+        for log_date in dates:
             if log_date == expected_date:
                 streak += 1
                 expected_date -= timedelta(days=1)
@@ -230,42 +259,27 @@ class StepService:
 
         return streak
 
-    def _calculate_longest_streak(self, history: List[Dict[str, Any]]) -> int:
+    def _calculate_longest_streak(self, dates: List[date]) -> int:
         """
         Calculate longest consecutive days streak.
 
         Args:
-            history: List of step logs
+            dates: Logged dates
 
         Returns:
             Longest streak count
         """
-        if not history:
-            return 0
-
-        # Sort by date
-        sorted_history = sorted(
-            history,
-            key=lambda x: datetime.strptime(x.get("date", "1900-01-01"), "%Y-%m-%d")
-        )
-
-        max_streak = 1
-        current_streak = 1
-
-        for i in range(1, len(sorted_history)):
-            prev_date = datetime.strptime(
-                sorted_history[i-1].get("date", "1900-01-01"),
-                "%Y-%m-%d"
-            ).date()
-            curr_date = datetime.strptime(
-                sorted_history[i].get("date", "1900-01-01"),
-                "%Y-%m-%d"
-            ).date()
-
-            if (curr_date - prev_date).days == 1:
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 1
+        date_set = set(dates)
+        one_day = timedelta(days=1)
+        max_streak = 0
+
+        for start in date_set:
+            # Only walk forward from the first day of each run
+            if start - one_day in date_set:
+                continue
+            length = 1
+            while start + timedelta(days=length) in date_set:
+                length += 1
+            max_streak = max(max_streak, length)
 
         return max_streak
@@ -7,7 +7,7 @@ This module handles environment variables and application settings using Pydanti
 import json
 from typing import List, Union, Any
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator
 
 
 class Settings(BaseSettings):
@@ -34,31 +34,26 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = Field(default="Oshi-Suta BATTLE API")
     VERSION: str = Field(default="0.1.0")
 
-    # CORS Configuration (will be parsed from string in model_validator)
-    CORS_ORIGINS: Any = Field(
+    # CORS Configuration (JSON list or comma-separated string in the environment)
+    CORS_ORIGINS: Union[List[str], str] = Field(
         default=["http://localhost:3000", "http://localhost:8000", "http://127.0.0.1:3000", "http://127.0.0.1:8000"]
     )
 
-    @model_validator(mode="before")
+    @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
-    def parse_cors_origins(cls, values: dict) -> dict:
+    def parse_cors_origins(cls, cors: Any) -> List[str]:
         """Parse CORS_ORIGINS from various formats."""
-        cors = values.get("CORS_ORIGINS")
-        if cors is None:
-            return values
-
         if isinstance(cors, str):
             # Try to parse as JSON first
             try:
                 parsed = json.loads(cors)
-                values["CORS_ORIGINS"] = parsed if isinstance(parsed, list) else [parsed]
+                return parsed if isinstance(parsed, list) else [parsed]
             except (json.JSONDecodeError, ValueError):
                 # Otherwise, treat as comma-separated
-                values["CORS_ORIGINS"] = [origin.strip() for origin in cors.split(",") if origin.strip()]
-        elif not isinstance(cors, list):
-            values["CORS_ORIGINS"] = [str(cors)]
-
-        return values
+                return [origin.strip() for origin in cors.split(",") if origin.strip()]
+        if not isinstance(cors, list):
+            return [str(cors)]
+        return cors
 
     # Environment
     ENV: str = Field(default="development")
@@ -4,10 +4,13 @@ Security utility functions.
 This module provides security-related functions for authentication and authorization.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
-import requests
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Tuple
+import httpx
 import logging
+import firebase_admin
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
@@ -15,8 +18,51 @@ from app.settings import settings
 
 logger = logging.getLogger(__name__)
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context (cost and variant pinned rather than left to passlib defaults)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    bcrypt__rounds=12,
+    bcrypt__ident="2b",
+    deprecated="auto"
+)
+
+# JWT signing parameters, resolved once from settings
+_JWT_KEY = settings.SECRET_KEY
+_JWT_ALGORITHMS = [settings.ALGORITHM]
+
+# Firebase Auth (Identity Toolkit) REST API: end-user methods (API key) and
+# admin methods scoped to the project (service-account OAuth token, as firebase_admin uses)
+_IDENTITY_TOOLKIT_URL = "https://identitytoolkit.googleapis.com/v1/accounts"
+_IDENTITY_TOOLKIT_ADMIN_URL = (
+    f"https://identitytoolkit.googleapis.com/v1/projects/{settings.FIREBASE_PROJECT_ID}/accounts"
+)
+
+# Cached service-account access token: (token, expires_at epoch seconds)
+_admin_token: Optional[Tuple[str, float]] = None
+# Refresh the token this many seconds before it expires
+_ADMIN_TOKEN_REFRESH_MARGIN = 300
+
+# Shared async HTTP client so Firebase Auth REST calls reuse keep-alive connections
+# (created on first use, inside the running event loop; see _get_http_client)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it if it is missing or closed."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+    return _http_client
+
+
+class FirebaseAuthError(Exception):
+    """Error returned by the Firebase Auth REST API (e.g. EMAIL_EXISTS)."""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
 
 
 def hash_password(password: str) -> str:
@@ -65,7 +111,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALGORITHMS[0])
 
     return encoded_jwt
 
@@ -81,13 +127,96 @@ def decode_access_token(token: str) -> Optional[dict]:
         Decoded token payload as dictionary, or None if invalid
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         return payload
     except JWTError:
         return None
 
 
-def verify_password_with_firebase(email: str, password: str) -> Optional[dict]:
+async def _identity_toolkit_post(url: str, payload: dict, **kwargs: Any) -> dict:
+    """
+    POST to the Identity Toolkit API and unwrap its error format.
+
+    Raises:
+        FirebaseAuthError: If Firebase rejects the request
+    """
+    response = await _get_http_client().post(url, json=payload, **kwargs)
+    data = response.json()
+
+    if response.status_code != 200:
+        raise FirebaseAuthError(data.get("error", {}).get("message", "Unknown error"))
+
+    return data
+
+
+async def _identity_toolkit_call(method: str, payload: dict) -> dict:
+    """
+    Call an end-user Firebase Auth REST API method with the web API key.
+
+    Args:
+        method: Identity Toolkit method name (e.g. "signInWithPassword")
+        payload: JSON request body
+
+    Returns:
+        Response JSON
+
+    Raises:
+        FirebaseAuthError: If the API key is missing or Firebase rejects the request
+    """
+    if not settings.FIREBASE_WEB_API_KEY:
+        raise FirebaseAuthError("FIREBASE_WEB_API_KEY is not configured")
+
+    return await _identity_toolkit_post(
+        f"{_IDENTITY_TOOLKIT_URL}:{method}",
+        payload,
+        params={"key": settings.FIREBASE_WEB_API_KEY}
+    )
+
+
+async def _get_admin_access_token() -> str:
+    """
+    Get an OAuth access token for the Firebase app's service account.
+
+    The token is cached until shortly before it expires; refreshing it is a
+    blocking network call, so it runs off the event loop.
+    """
+    global _admin_token
+    if _admin_token is None or _admin_token[1] - _ADMIN_TOKEN_REFRESH_MARGIN <= time.time():
+        credential = firebase_admin.get_app().credential
+        token_info = await asyncio.to_thread(credential.get_access_token)
+        expires_at = token_info.expiry.replace(tzinfo=timezone.utc).timestamp()
+        _admin_token = (token_info.access_token, expires_at)
+    return _admin_token[0]
+
+
+async def _identity_toolkit_admin_call(method: str, payload: dict) -> dict:
+    """
+    Call an admin Firebase Auth REST API method with service-account credentials.
+
+    These are the project-scoped endpoints firebase_admin uses, so they are
+    not subject to end-user restrictions (disabled sign-up, email
+    enumeration protection).
+
+    Args:
+        method: Identity Toolkit method name (e.g. "update"), or "" to create an account
+        payload: JSON request body
+
+    Returns:
+        Response JSON
+
+    Raises:
+        FirebaseAuthError: If Firebase rejects the request
+    """
+    token = await _get_admin_access_token()
+    url = f"{_IDENTITY_TOOLKIT_ADMIN_URL}:{method}" if method else _IDENTITY_TOOLKIT_ADMIN_URL
+    return await _identity_toolkit_post(
+        url,
+        payload,
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+
+async def verify_password_with_firebase(email: str, password: str) -> Optional[dict]:
     """
     Verify user credentials with Firebase Authentication REST API.
 
@@ -101,13 +230,6 @@ def verify_password_with_firebase(email: str, password: str) -> Optional[dict]:
     Returns:
         User data dict if authentication succeeds, None otherwise
     """
-    if not settings.FIREBASE_WEB_API_KEY:
-        logger.error("FIREBASE_WEB_API_KEY is not configured")
-        return None
-
-    # Firebase Auth REST API endpoint
-    url = f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={settings.FIREBASE_WEB_API_KEY}"
-
     payload = {
         "email": email,
         "password": password,
@@ -115,24 +237,18 @@ def verify_password_with_firebase(email: str, password: str) -> Optional[dict]:
     }
 
     try:
-        response = requests.post(url, json=payload, timeout=10)
-
-        if response.status_code == 200:
-            data = response.json()
-            return {
-                "local_id": data.get("localId"),
-                "email": data.get("email"),
-                "id_token": data.get("idToken"),
-                "refresh_token": data.get("refreshToken"),
-                "expires_in": data.get("expiresIn")
-            }
-        else:
-            error_data = response.json()
-            error_message = error_data.get("error", {}).get("message", "Unknown error")
-            logger.warning(f"Firebase Auth failed for {email}: {error_message}")
-            return None
-
-    except requests.RequestException as e:
+        data = await _identity_toolkit_call("signInWithPassword", payload)
+        return {
+            "local_id": data.get("localId"),
+            "email": data.get("email"),
+            "id_token": data.get("idToken"),
+            "refresh_token": data.get("refreshToken"),
+            "expires_in": data.get("expiresIn")
+        }
+    except FirebaseAuthError as e:
+        logger.warning(f"Firebase Auth failed for {email}: {e.message}")
+        return None
+    except httpx.HTTPError as e:
         logger.error(f"Firebase Auth request error: {str(e)}")
         return None
     except Exception as e:
@@ -140,6 +256,64 @@ def verify_password_with_firebase(email: str, password: str) -> Optional[dict]:
         return None
 
 
+async def create_firebase_user(email: str, password: str, display_name: str) -> str:
+    """
+    Create an email/password account in Firebase Authentication.
+
+    Args:
+        email: User's email address
+        password: User's plain text password
+        display_name: Display name for the account
+
+    Returns:
+        Firebase UID of the new account
+
+    Raises:
+        FirebaseAuthError: If Firebase rejects the request (e.g. EMAIL_EXISTS)
+    """
+    data = await _identity_toolkit_admin_call("", {
+        "email": email,
+        "password": password,
+        "displayName": display_name
+    })
+    return data["localId"]
+
+
+async def update_firebase_user(uid: str, **fields: Any) -> None:
+    """
+    Update a Firebase account (e.g. email or password) with admin privileges.
+
+    Args:
+        uid: Firebase UID of the account
+        **fields: Account fields to update
+
+    Raises:
+        FirebaseAuthError: If Firebase rejects the request (e.g. EMAIL_EXISTS)
+    """
+    await _identity_toolkit_admin_call("update", {"localId": uid, **fields})
+
+
+async def delete_firebase_user(uid: str) -> None:
+    """
+    Delete a Firebase account with admin privileges.
+
+    Args:
+        uid: Firebase UID of the account
+
+    Raises:
+        FirebaseAuthError: If Firebase rejects the request
+    """
+    await _identity_toolkit_admin_call("delete", {"localId": uid})
+
+
+async def close_http_client() -> None:
+    """Close the shared Firebase Auth HTTP client; the next call creates a new one."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 def verify_firebase_token(token: str) -> Optional[dict]:
     """
     Verify a Firebase ID token.
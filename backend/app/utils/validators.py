@@ -5,7 +5,9 @@ This module provides validation functions for various data types used in the app
 """
 
 import re
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+from typing import Optional
 from app.config.constants import (
     VALID_CLUB_IDS,
     MIN_NICKNAME_LENGTH,
@@ -18,6 +20,13 @@ from app.config.constants import (
     MAX_STEPS,
 )
 
+# Allow alphanumeric, spaces, and common special characters
+_NICKNAME_RE = re.compile(r"^[a-zA-Z0-9\s\-_あ-んア-ン一-龥]+$")
+
+# ASCII digits only; used with fullmatch so a trailing newline is rejected
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
 
 def validate_steps(steps: int) -> bool:
     """
@@ -40,6 +49,34 @@ def validate_steps(steps: int) -> bool:
     return MIN_STEPS <= steps <= MAX_STEPS
 
 
+@lru_cache(maxsize=1024)
+def parse_date(date_str: str) -> Optional[date]:
+    """
+    Parse a YYYY-MM-DD string without going through strptime.
+
+    Results are memoized; synced dates cluster around the last few days.
+
+    Args:
+        date_str: Date string to parse
+
+    Returns:
+        The date, or None if the string is malformed or not a real date
+
+    Examples:
+        >>> parse_date("2025-10-10")
+        datetime.date(2025, 10, 10)
+        >>> parse_date("2025-13-01") is None
+        True
+    """
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return None
+    try:
+        return date(int(match[1]), int(match[2]), int(match[3]))
+    except ValueError:
+        return None
+
+
 def validate_date_format(date_str: str) -> bool:
     """
     Validate if the date string is in YYYY-MM-DD format and is valid.
@@ -58,38 +95,32 @@ def validate_date_format(date_str: str) -> bool:
         >>> validate_date_format("10-10-2025")
         False
     """
-    # Check format with regex
-    pattern = r"^\d{4}-\d{2}-\d{2}$"
-    if not re.match(pattern, date_str):
-        return False
+    return parse_date(date_str) is not None
 
-    # Check if it's a valid date
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return True
-    except ValueError:
-        return False
 
-
-def validate_date_not_future(date_str: str) -> bool:
+def parse_and_validate_date(date_str: str) -> date:
     """
-    Validate that the date is not in the future.
+    Parse a YYYY-MM-DD string and reject dates in the future.
 
     Args:
         date_str: Date string in YYYY-MM-DD format
 
     Returns:
-        True if not in future, False otherwise
+        The parsed date
+
+    Raises:
+        ValueError: If the string is not a valid date or is in the future
 
     Examples:
-        >>> validate_date_not_future("2020-01-01")
-        True
+        >>> parse_and_validate_date("2020-01-01")
+        datetime.date(2020, 1, 1)
     """
-    try:
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        return date_obj.date() <= datetime.now().date()
-    except ValueError:
-        return False
+    date_obj = parse_date(date_str)
+    if date_obj is None:
+        raise ValueError(f"Invalid date format: {date_str}")
+    if date_obj > date.today():
+        raise ValueError("Date cannot be in the future")
+    return date_obj
 
 
 def validate_club_id(club_id: str) -> bool:
@@ -127,8 +158,7 @@ def validate_email(email: str) -> bool:
         >>> validate_email("invalid-email")
         False
     """
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_RE.match(email))
 
 
 def validate_password_strength(password: str) -> tuple[bool, str]:
@@ -165,6 +195,7 @@ def validate_password_strength(password: str) -> tuple[bool, str]:
     return True, ""
 
 
+@lru_cache(maxsize=1024)
 def validate_nickname(nickname: str) -> tuple[bool, str]:
     """
     Validate nickname format and length.
@@ -187,9 +218,7 @@ def validate_nickname(nickname: str) -> tuple[bool, str]:
     if len(nickname) > MAX_NICKNAME_LENGTH:
         return False, f"Nickname must be between {MIN_NICKNAME_LENGTH} and {MAX_NICKNAME_LENGTH} characters"
 
-    # Allow alphanumeric, spaces, and common special characters
-    pattern = r"^[a-zA-Z0-9\s\-_あ-んア-ン一-龥]+$"
-    if not re.match(pattern, nickname):
+    if not _NICKNAME_RE.match(nickname):
         return False, "Nickname contains invalid characters"
 
     return True, ""
@@ -4,15 +4,20 @@
 アンダースコア形式からハイフン形式に変換
 
 使用方法:
-    python scripts/migrate_club_ids.py [--dry-run]
+    python scripts/migrate_club_ids.py [--dry-run] [--verbose]
 
 オプション:
     --dry-run: 実際の変更を行わず、変更内容のみを表示
+    --verbose: 検証時にユーザーのクラブID分布を表示
 """
 
 import argparse
+import functools
+import itertools
 import sys
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # プロジェクトルートをPythonパスに追加
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -20,6 +25,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import firebase_admin
 from firebase_admin import credentials, firestore
 from dotenv import load_dotenv
+from google.api_core.exceptions import Aborted, DeadlineExceeded
+from google.cloud.firestore_v1.base_query import FieldFilter
 
 # 環境変数を読み込み
 load_dotenv()
@@ -39,13 +46,27 @@ MIGRATION_MAP = {
     "consadole_sapporo": "consadole-sapporo",
     "shimizu_spulse": "shimizu-spulse",
 }
-
-
+OLD_IDS = frozenset(MIGRATION_MAP)
+NEW_IDS = frozenset(MIGRATION_MAP.values())
+# クラブIDの形式（検証時の表示用）
+FORMAT_BY_ID = {**dict.fromkeys(NEW_IDS, "NEW"), **dict.fromkeys(OLD_IDS, "OLD")}
+
+# 1バッチあたりの書き込み数（Firestoreの上限は500）
+BATCH_SIZE = 400
+# コミットの最大試行回数
+MAX_COMMIT_ATTEMPTS = 5
+# 並行してコミットするバッチ数
+COMMIT_WORKERS = 20
+# in クエリに指定できる値の上限
+IN_QUERY_LIMIT = 30
+
+
+@functools.lru_cache(maxsize=1)
 def init_firebase():
-    """Firebase初期化"""
+    """Firebase初期化（2回目以降はキャッシュ済みのアプリを返す）"""
     try:
         # すでに初期化されている場合はスキップ
-        firebase_admin.get_app()
+        app = firebase_admin.get_app()
         print("✓ Firebase already initialized")
     except ValueError:
         # 初期化されていない場合は初期化
@@ -56,9 +77,22 @@ def init_firebase():
             sys.exit(1)
 
         cred = credentials.Certificate(cred_path)
-        firebase_admin.initialize_app(cred)
+        app = firebase_admin.initialize_app(cred)
         print("✓ Firebase initialized successfully")
 
+    return app
+
+
+def commit_with_retry(batch):
+    """バッチをコミット（一時的なエラーは指数バックオフで再試行）"""
+    for attempt in range(MAX_COMMIT_ATTEMPTS):
+        try:
+            return batch.commit()
+        except (Aborted, DeadlineExceeded):
+            if attempt == MAX_COMMIT_ATTEMPTS - 1:
+                raise
+            time.sleep(2 ** attempt)
+
 
 def migrate_users(db, dry_run=False):
     """usersコレクションのclub_idを更新"""
@@ -67,44 +101,70 @@ def migrate_users(db, dry_run=False):
     print("="*60)
 
     users_ref = db.collection('users')
-    users = users_ref.stream()
+
+    # 旧形式のclub_idを持つユーザーだけを、club_idフィールドのみ取得
+    old_ids = list(MIGRATION_MAP)
+    users = itertools.chain.from_iterable(
+        users_ref
+        .where(filter=FieldFilter('club_id', 'in', old_ids[i:i + IN_QUERY_LIMIT]))
+        .select(['club_id'])
+        .stream()
+        for i in range(0, len(old_ids), IN_QUERY_LIMIT)
+    )
 
     updated_count = 0
-    skipped_count = 0
+    batch = db.batch()
+    pending = 0
+    # 進捗表示はBATCH_SIZE件ごとにまとめて書き出す
+    output = []
 
-    for user_doc in users:
-        user_data = user_doc.to_dict()
-        old_club_id = user_data.get('club_id')
+    # 満杯になったバッチは並行してコミット（順序は問わない）
+    with ThreadPoolExecutor(max_workers=COMMIT_WORKERS) as executor:
+        commits = []
 
-        if old_club_id in MIGRATION_MAP:
+        for user_doc in users:
+            old_club_id = user_doc.get('club_id')
             new_club_id = MIGRATION_MAP[old_club_id]
 
             if dry_run:
-                print(f"  [DRY RUN] Would update user {user_doc.id}: {old_club_id} -> {new_club_id}")
+                output.append(f"  [DRY RUN] Would update user {user_doc.id}: {old_club_id} -> {new_club_id}\n")
             else:
-                users_ref.document(user_doc.id).update({
+                batch.update(user_doc.reference, {
                     'club_id': new_club_id
                 })
-                print(f"  ✓ Updated user {user_doc.id}: {old_club_id} -> {new_club_id}")
+                pending += 1
+                if pending == BATCH_SIZE:
+                    commits.append(executor.submit(commit_with_retry, batch))
+                    batch = db.batch()
+                    pending = 0
+                output.append(f"  ✓ Updated user {user_doc.id}: {old_club_id} -> {new_club_id}\n")
 
             updated_count += 1
-        elif old_club_id:
-            # すでに新形式の場合、または移行対象外の場合
-            if old_club_id in MIGRATION_MAP.values():
-                skipped_count += 1
-            else:
-                print(f"  ⚠️  Unknown club_id in user {user_doc.id}: {old_club_id}")
-                skipped_count += 1
+            if len(output) == BATCH_SIZE:
+                sys.stdout.write(''.join(output))
+                output.clear()
+
+        if pending:
+            commits.append(executor.submit(commit_with_retry, batch))
+        sys.stdout.write(''.join(output))
+
+        # 失敗したコミットがあれば例外を送出
+        for commit in commits:
+            commit.result()
 
     print(f"\n  Total users processed:")
     print(f"    - Updated: {updated_count}")
-    print(f"    - Skipped: {skipped_count}")
 
     return updated_count
 
 
-def migrate_clubs(db, dry_run=False):
-    """clubsコレクションのドキュメントIDを更新"""
+def fetch_clubs(db):
+    """clubsコレクション全体を1回のクエリで取得（ドキュメントID -> データ）"""
+    return {doc.id: doc.to_dict() for doc in db.collection('clubs').stream()}
+
+
+def migrate_clubs(db, clubs, dry_run=False):
+    """clubsコレクションのドキュメントIDを更新（clubs は fetch_clubs の結果）"""
     print("\n" + "="*60)
     print("2. Migrating clubs collection...")
     print("="*60)
@@ -113,33 +173,39 @@ def migrate_clubs(db, dry_run=False):
     migrated_count = 0
     skipped_count = 0
 
-    for old_id, new_id in MIGRATION_MAP.items():
-        old_doc = clubs_ref.document(old_id).get()
+    # ドキュメント参照は一度だけ作成し、書き込みで使い回す
+    old_refs = {old_id: clubs_ref.document(old_id) for old_id in MIGRATION_MAP}
+    new_refs = {new_id: clubs_ref.document(new_id) for new_id in MIGRATION_MAP.values()}
+
+    # 作成と削除は1つのバッチでまとめてコミット（12クラブ × 2件で上限内）
+    batch = db.batch()
 
-        if old_doc.exists:
+    for old_id, new_id in MIGRATION_MAP.items():
+        if old_id in clubs:
             if dry_run:
                 print(f"  [DRY RUN] Would migrate club: {old_id} -> {new_id}")
             else:
                 # 新しいドキュメントを作成
-                club_data = old_doc.to_dict()
-                club_data['club_id'] = new_id
-                clubs_ref.document(new_id).set(club_data)
+                club_data = {**clubs[old_id], 'club_id': new_id}
+                batch.set(new_refs[new_id], club_data)
 
                 # 古いドキュメントを削除
-                clubs_ref.document(old_id).delete()
+                batch.delete(old_refs[old_id])
 
                 print(f"  ✓ Migrated club: {old_id} -> {new_id}")
 
             migrated_count += 1
         else:
             # 新しいIDのドキュメントが存在するか確認
-            new_doc = clubs_ref.document(new_id).get()
-            if new_doc.exists:
+            if new_id in clubs:
                 skipped_count += 1
             else:
                 print(f"  ⚠️  Club document not found: {old_id}")
                 skipped_count += 1
 
+    if migrated_count and not dry_run:
+        commit_with_retry(batch)
+
     print(f"\n  Total clubs processed:")
     print(f"    - Migrated: {migrated_count}")
     print(f"    - Skipped: {skipped_count}")
@@ -147,28 +213,18 @@ def migrate_clubs(db, dry_run=False):
     return migrated_count
 
 
-def verify_migration(db):
-    """マイグレーション結果を検証"""
+def verify_migration(db, verbose=False):
+    """マイグレーション結果を検証（verbose時はユーザーのクラブID分布も表示）"""
     print("\n" + "="*60)
     print("3. Verifying migration...")
     print("="*60)
 
-    clubs_ref = db.collection('clubs')
     users_ref = db.collection('users')
 
-    # 新形式のクラブIDが存在することを確認
-    new_clubs = []
-    old_clubs = []
-
-    for new_id in MIGRATION_MAP.values():
-        doc = clubs_ref.document(new_id).get()
-        if doc.exists:
-            new_clubs.append(new_id)
-
-    for old_id in MIGRATION_MAP.keys():
-        doc = clubs_ref.document(old_id).get()
-        if doc.exists:
-            old_clubs.append(old_id)
+    # 新形式のクラブIDが存在することを確認（移行後の状態を1回のクエリで取得）
+    clubs = fetch_clubs(db)
+    new_clubs = [new_id for new_id in MIGRATION_MAP.values() if new_id in clubs]
+    old_clubs = [old_id for old_id in MIGRATION_MAP if old_id in clubs]
 
     print(f"\n  Clubs with new format IDs: {len(new_clubs)}")
     print(f"  Clubs with old format IDs: {len(old_clubs)}")
@@ -178,23 +234,35 @@ def verify_migration(db):
         for club in old_clubs:
             print(f"    - {club}")
 
-    # ユーザーのクラブIDを確認
-    users = users_ref.stream()
-    user_club_ids = {}
-
-    for user_doc in users:
-        user_data = user_doc.to_dict()
-        club_id = user_data.get('club_id')
-        if club_id:
-            user_club_ids[club_id] = user_club_ids.get(club_id, 0) + 1
-
-    print(f"\n  User club_id distribution:")
-    for club_id, count in sorted(user_club_ids.items()):
-        format_type = "NEW" if '-' in club_id else "OLD"
-        print(f"    - {club_id}: {count} users [{format_type}]")
+    # 旧形式のclub_idを持つユーザーが1件でも残っているかを確認
+    old_ids = list(OLD_IDS)
+    has_old_format_users = any(
+        users_ref
+        .where(filter=FieldFilter('club_id', 'in', old_ids[i:i + IN_QUERY_LIMIT]))
+        .limit(1)
+        .get()
+        for i in range(0, len(old_ids), IN_QUERY_LIMIT)
+    )
+
+    # ユーザーのクラブIDの分布（クラブIDごとにサーバー側で件数を集計）
+    if verbose:
+        def count_users(club_id):
+            result = users_ref.where(filter=FieldFilter('club_id', '==', club_id)).count().get()
+            return club_id, result[0][0].value
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            user_club_ids = {
+                club_id: count
+                for club_id, count in executor.map(count_users, OLD_IDS | NEW_IDS)
+                if count
+            }
+
+        print(f"\n  User club_id distribution:")
+        for club_id, count in sorted(user_club_ids.items()):
+            format_type = FORMAT_BY_ID.get(club_id, "UNKNOWN")
+            print(f"    - {club_id}: {count} users [{format_type}]")
 
     # 検証結果
-    has_old_format_users = any('_' in cid for cid in user_club_ids.keys())
     has_old_format_clubs = len(old_clubs) > 0
 
     if not has_old_format_users and not has_old_format_clubs:
@@ -209,12 +277,18 @@ def main():
     parser = argparse.ArgumentParser(description='Migrate club IDs from underscore to hyphen format')
     parser.add_argument('--dry-run', action='store_true',
                        help='Show what would be changed without making actual changes')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Show the user club_id distribution during verification')
     args = parser.parse_args()
 
     print("="*60)
     print("Club ID Migration Script")
     print("="*60)
 
+    # Firebase初期化（出力が確認プロンプトと混ざらないよう入力前に完了させる）
+    init_firebase()
+    db = firestore.client()
+
     if args.dry_run:
         print("\n⚠️  DRY RUN MODE - No actual changes will be made\n")
     else:
@@ -225,18 +299,14 @@ def main():
             print("Migration cancelled.")
             sys.exit(0)
 
-    # Firebase初期化
-    init_firebase()
-    db = firestore.client()
-
     # マイグレーション実行
     try:
         users_updated = migrate_users(db, dry_run=args.dry_run)
-        clubs_migrated = migrate_clubs(db, dry_run=args.dry_run)
+        clubs_migrated = migrate_clubs(db, fetch_clubs(db), dry_run=args.dry_run)
 
         # 検証（実際の変更を行った場合のみ）
         if not args.dry_run:
-            verify_migration(db)
+            verify_migration(db, verbose=args.verbose)
 
         # 完了メッセージ
         print("\n" + "="*60)
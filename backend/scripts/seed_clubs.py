@@ -5,6 +5,9 @@ Seed J-League club data to Firestore.
 This script adds initial club data to the Firestore database.
 """
 
+import functools
+import hashlib
+import json
 import os
 import sys
 from pathlib import Path
@@ -201,23 +204,32 @@ CLUBS_DATA = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
 def initialize_firebase():
-    """Initialize Firebase Admin SDK."""
+    """Initialize Firebase Admin SDK once and return the app."""
     try:
-        firebase_admin.get_app()
+        app = firebase_admin.get_app()
         print("Firebase already initialized")
     except ValueError:
         try:
             cred = credentials.Certificate(settings.FIREBASE_CREDENTIALS_PATH)
-            firebase_admin.initialize_app(cred, {
+            app = firebase_admin.initialize_app(cred, {
                 'projectId': settings.FIREBASE_PROJECT_ID,
             })
             print("Firebase initialized successfully")
         except Exception as e:
             print(f"Warning: Firebase credentials not found: {str(e)}")
-            firebase_admin.initialize_app()
+            app = firebase_admin.initialize_app()
             print("Firebase initialized with default credentials")
 
+    return app
+
+
+def _seed_hash(club_data: dict) -> str:
+    """Return a SHA-256 digest of the canonicalized club seed data."""
+    payload = json.dumps(club_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
 
 def seed_clubs():
     """Seed club data to Firestore."""
@@ -233,30 +245,41 @@ def seed_clubs():
         print("-" * 50)
 
         clubs_collection = db.collection("clubs")
+        doc_refs = [clubs_collection.document(club["club_id"]) for club in CLUBS_DATA]
+
+        # Check which clubs already exist in a single batched read
+        existing = {doc.id: doc.to_dict() for doc in db.get_all(doc_refs) if doc.exists}
 
         added_count = 0
         updated_count = 0
+        unchanged_count = 0
 
-        for club_data in CLUBS_DATA:
-            club_id = club_data["club_id"]
-
-            # Check if club already exists
-            doc_ref = clubs_collection.document(club_id)
-            doc = doc_ref.get()
+        # Upsert all clubs concurrently; failed writes are retried up to 5 times
+        bulk_writer = db.bulk_writer()
+        bulk_writer.on_write_error(lambda error, _: error.attempts < 5)
 
-            if doc.exists:
+        for doc_ref, club_data in zip(doc_refs, CLUBS_DATA):
+            seed_hash = _seed_hash(club_data)
+            if doc_ref.id in existing:
+                # Skip the write when the seeded fields have not changed
+                if existing[doc_ref.id].get("_seed_hash") == seed_hash:
+                    unchanged_count += 1
+                    continue
                 print(f"⚠️  Club '{club_data['name']}' already exists. Updating...")
-                doc_ref.update(club_data)
                 updated_count += 1
             else:
-                print(f"✓ Adding club: {club_data['name']} ({club_id})")
-                doc_ref.set(club_data)
+                print(f"✓ Adding club: {club_data['name']} ({doc_ref.id})")
                 added_count += 1
+            bulk_writer.set(doc_ref, {**club_data, "_seed_hash": seed_hash}, merge=True)
+
+        # Blocks until every write has been flushed
+        bulk_writer.close()
 
         print("-" * 50)
         print(f"✓ Successfully added {added_count} new clubs")
         print(f"✓ Updated {updated_count} existing clubs")
-        print(f"✓ Total clubs in database: {added_count + updated_count}")
+        print(f"✓ Skipped {unchanged_count} unchanged clubs")
+        print(f"✓ Total clubs in database: {added_count + updated_count + unchanged_count}")
 
     except Exception as e:
         print(f"❌ Error seeding clubs: {str(e)}")
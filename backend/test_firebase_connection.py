@@ -4,6 +4,8 @@ Firebase connection test script.
 This script tests the Firebase connection and verifies that the credentials are properly configured.
 """
 
+import argparse
+import functools
 import os
 import sys
 import logging
@@ -25,8 +27,28 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def test_firebase_connection():
-    """Test Firebase connection and basic operations."""
+@functools.lru_cache(maxsize=1)
+def _get_or_init_app(creds_path: str) -> firebase_admin.App:
+    """Return the default Firebase app, initializing it on first use."""
+    try:
+        app = firebase_admin.get_app()
+        print("   ⚠️  Firebase already initialized, using existing app")
+    except ValueError:
+        cred = credentials.Certificate(creds_path)
+        app = firebase_admin.initialize_app(cred, {
+            'projectId': settings.FIREBASE_PROJECT_ID,
+        })
+        print("   ✅ Firebase Admin SDK initialized successfully")
+    return app
+
+
+def test_firebase_connection(full: bool = False):
+    """
+    Test Firebase connection and basic operations.
+
+    Args:
+        full: Also read the test document back from the server after writing it
+    """
 
     print("\n" + "="*60)
     print("Firebase Connection Test")
@@ -47,17 +69,7 @@ def test_firebase_connection():
     print(f"   Project ID: {settings.FIREBASE_PROJECT_ID}")
 
     try:
-        # Check if already initialized
-        try:
-            firebase_admin.get_app()
-            print("   ⚠️  Firebase already initialized, using existing app")
-        except ValueError:
-            # Initialize Firebase
-            cred = credentials.Certificate(creds_path)
-            firebase_admin.initialize_app(cred, {
-                'projectId': settings.FIREBASE_PROJECT_ID,
-            })
-            print("   ✅ Firebase Admin SDK initialized successfully")
+        _get_or_init_app(creds_path)
     except Exception as e:
         print(f"   ❌ Failed to initialize Firebase: {str(e)}")
         return False
@@ -96,21 +108,30 @@ def test_firebase_connection():
     try:
         test_collection = db.collection('_connection_test')
         test_doc = test_collection.document('test')
-        test_doc.set({
+
+        test_data = {
             'test': True,
             'timestamp': firestore.SERVER_TIMESTAMP,
             'message': 'Connection test successful'
-        })
-        print("   ✅ Write operation successful")
-
-        # Read it back
-        doc = test_doc.get()
-        if doc.exists:
-            print("   ✅ Read operation successful")
-            print(f"   📝 Document data: {doc.to_dict()}")
-
-        # Clean up
-        test_doc.delete()
+        }
+
+        if full:
+            # Deep verification: write, read back from the server, then clean up
+            test_doc.set(test_data)
+            print("   ✅ Write operation successful")
+            snapshot = test_doc.get()
+            if not snapshot.exists:
+                raise RuntimeError("Test document not found after write")
+            print(f"   📖 Read back: {snapshot.get('message')}")
+            test_doc.delete()
+        else:
+            # Write and clean up in a single commit; the write results confirm it
+            batch = db.batch()
+            batch.set(test_doc, test_data)
+            batch.delete(test_doc)
+            write_results = batch.commit()
+            print("   ✅ Write operation successful")
+            print(f"   📝 Committed {len(write_results)} writes at {write_results[-1].update_time}")
         print("   ✅ Delete operation successful (cleanup completed)")
 
     except Exception as e:
@@ -125,8 +146,13 @@ def test_firebase_connection():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Test the Firebase connection')
+    parser.add_argument('--full', action='store_true',
+                        help='Read the test document back from the server after writing it')
+    args = parser.parse_args()
+
     try:
-        success = test_firebase_connection()
+        success = test_firebase_connection(full=args.full)
         sys.exit(0 if success else 1)
     except Exception as e:
         logger.error(f"Unexpected error during test: {str(e)}", exc_info=True)
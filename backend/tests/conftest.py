@@ -0,0 +1,119 @@
+"""
+Shared test fixtures.
+
+Firebase Auth and Firestore are replaced with in-memory fakes so the
+suite runs offline and every test can assert an exact status code.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import pytest
+import pytest_asyncio
+from google.api_core.exceptions import AlreadyExists, NotFound
+from httpx import ASGITransport, AsyncClient
+
+from app import dependencies
+from app.api.v1.endpoints import auth as auth_endpoints
+from app.main import app
+
+TEST_USER_ID = "test-user"
+
+
+class FakeAuth:
+    """In-memory stand-in for the Firebase Auth account API."""
+
+    def __init__(self):
+        self.accounts: Dict[str, str] = {}
+
+    async def create_user(self, email: str, password: str, display_name: str) -> str:
+        uid = f"uid-{email}"
+        self.accounts[uid] = email
+        return uid
+
+    async def delete_user(self, uid: str) -> None:
+        self.accounts.pop(uid, None)
+
+
+class FakeRepository:
+    """In-memory stand-in for FirestoreRepository (plus the Firebase Auth accounts)."""
+
+    def __init__(self):
+        self.auth = FakeAuth()
+        self.clubs: Dict[str, Dict[str, Any]] = {
+            "urawa-reds": {"name": "Urawa Reds", "active_members": 1},
+            "kashima-antlers": {"name": "Kashima Antlers", "active_members": 0}
+        }
+        self.users: Dict[str, Dict[str, Any]] = {
+            TEST_USER_ID: {
+                "email": "existing@example.com",
+                "nickname": "Existing",
+                "club_id": "urawa-reds",
+                "total_points": 0,
+                "total_steps": 0
+            }
+        }
+
+    async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        return self.users.get(user_id)
+
+    async def create_user_and_bump_club(
+        self,
+        user_id: str,
+        user_data: Dict[str, Any],
+        club_id: str
+    ) -> None:
+        if club_id not in self.clubs:
+            raise NotFound(f"Club {club_id} not found")
+        if user_id in self.users:
+            raise AlreadyExists(f"User {user_id} already exists")
+        self.users[user_id] = user_data
+        self.clubs[club_id]["active_members"] += 1
+
+    async def get_club(self, club_id: str) -> Optional[Dict[str, Any]]:
+        return self.clubs.get(club_id)
+
+    async def move_user_to_club(
+        self,
+        user_id: str,
+        old_club_id: Optional[str],
+        data: Dict[str, Any]
+    ) -> None:
+        new_club_id = data["club_id"]
+        if new_club_id not in self.clubs:
+            raise NotFound(f"Club {new_club_id} not found")
+        self.users[user_id].update(data)
+        old_club = self.clubs.get(old_club_id)
+        if old_club and old_club["active_members"] > 0:
+            old_club["active_members"] -= 1
+        self.clubs[new_club_id]["active_members"] += 1
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Use one event loop for the whole session so the client can be shared."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(autouse=True)
+def fake_firebase(monkeypatch):
+    """Route Firebase Auth and Firestore calls to fresh in-memory fakes for each test."""
+    repo = FakeRepository()
+    app.dependency_overrides[dependencies.get_firestore_repository] = lambda: repo
+    monkeypatch.setattr(dependencies, "get_cached_user", repo.get_user)
+    monkeypatch.setattr(dependencies.firebase_auth, "verify_id_token", lambda token: {"uid": TEST_USER_ID})
+    monkeypatch.setattr(auth_endpoints, "create_firebase_user", repo.auth.create_user)
+    monkeypatch.setattr(auth_endpoints, "delete_firebase_user", repo.auth.delete_user)
+
+    yield repo
+
+    app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """HTTP client bound to the app, reused by every test."""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
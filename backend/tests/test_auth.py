@@ -3,57 +3,99 @@ Authentication endpoint tests.
 """
 
 import pytest
-from httpx import AsyncClient
-from app.main import app
 
 
 @pytest.mark.asyncio
-async def test_register_user():
+async def test_register_user(client, fake_firebase):
     """Test user registration endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "email": "test@example.com",
-                "password": "TestPass123",
-                "club_id": "urawa-reds",
-                "nickname": "TestUser"
-            }
-        )
-        # Note: This will fail without proper Firebase setup
-        # In production, mock Firebase Auth
-        assert response.status_code in [201, 500]  # Allow both for now
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "TestPass123",
+            "club_id": "urawa-reds",
+            "nickname": "TestUser"
+        }
+    )
+    assert response.status_code == 201
+    assert response.json()["club_id"] == "urawa-reds"
+    assert fake_firebase.clubs["urawa-reds"]["active_members"] == 2
 
 
 @pytest.mark.asyncio
-async def test_register_invalid_club():
+async def test_register_invalid_club(client):
     """Test registration with invalid club ID."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "email": "test@example.com",
-                "password": "TestPass123",
-                "club_id": "invalid-club",
-                "nickname": "TestUser"
-            }
-        )
-        # Note: Returns 500 when Firebase is not configured, 400 when configured
-        assert response.status_code in [400, 500]
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "TestPass123",
+            "club_id": "invalid-club",
+            "nickname": "TestUser"
+        }
+    )
+    assert response.status_code == 400
 
 
 @pytest.mark.asyncio
-async def test_register_weak_password():
+async def test_register_weak_password(client):
     """Test registration with weak password."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.post(
-            "/api/v1/auth/register",
-            json={
-                "email": "test@example.com",
-                "password": "weak",
-                "club_id": "urawa-reds",
-                "nickname": "TestUser"
-            }
-        )
-        # Note: Returns 422 (validation error) or 500 (Firebase not configured)
-        assert response.status_code in [422, 500]
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "test@example.com",
+            "password": "weak",
+            "club_id": "urawa-reds",
+            "nickname": "TestUser"
+        }
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_login_invalid_email(client):
+    """Test login with a malformed email address."""
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={
+            "email": "not-an-email",
+            "password": "TestPass123"
+        }
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_register_missing_club_document(client, fake_firebase):
+    """Test registration with a valid club ID whose document does not exist."""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "missing-club@example.com",
+            "password": "TestPass123",
+            "club_id": "fc-tokyo",
+            "nickname": "TestUser"
+        }
+    )
+    assert response.status_code == 404
+    assert "missing-club@example.com" not in fake_firebase.auth.accounts.values()
+
+
+@pytest.mark.asyncio
+async def test_register_club_deleted_before_write(client, fake_firebase, monkeypatch):
+    """Test that the Auth account is removed when the user document write fails."""
+    async def club_exists(club_id):
+        return {"name": club_id}
+
+    monkeypatch.setattr(fake_firebase, "get_club", club_exists)
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "deleted-club@example.com",
+            "password": "TestPass123",
+            "club_id": "fc-tokyo",
+            "nickname": "TestUser"
+        }
+    )
+    assert response.status_code == 404
+    assert "deleted-club@example.com" not in fake_firebase.auth.accounts.values()
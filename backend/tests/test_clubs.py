@@ -0,0 +1,32 @@
+"""
+Club endpoint tests.
+"""
+
+import pytest
+
+from tests.conftest import TEST_USER_ID
+
+
+@pytest.mark.asyncio
+async def test_join_club_moves_active_member(client, fake_firebase):
+    """Test that joining a club moves one active member from the old club."""
+    response = await client.post(
+        "/api/v1/clubs/kashima-antlers/join",
+        headers={"Authorization": "Bearer test_token"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["club_id"] == "kashima-antlers"
+    assert fake_firebase.users[TEST_USER_ID]["club_id"] == "kashima-antlers"
+    assert fake_firebase.clubs["urawa-reds"]["active_members"] == 0
+    assert fake_firebase.clubs["kashima-antlers"]["active_members"] == 1
+
+
+@pytest.mark.asyncio
+async def test_join_unknown_club(client):
+    """Test joining a club that does not exist."""
+    response = await client.post(
+        "/api/v1/clubs/no-such-club/join",
+        headers={"Authorization": "Bearer test_token"}
+    )
+    assert response.status_code == 404
@@ -0,0 +1,44 @@
+"""
+Firestore repository helper tests.
+"""
+
+from datetime import date, timedelta
+
+from app.config.constants import RECENT_STEPS_DAYS
+from app.repositories.firestore_repo import _plan_recent_steps
+
+
+def _entries(count):
+    """Summary entries for consecutive days, newest first."""
+    start = date(2024, 12, 31)
+    return [{"date": (start - timedelta(days=i)).isoformat()} for i in range(count)]
+
+
+def test_plan_recent_steps_adds_entry_within_window():
+    """Test that a new entry is added and nothing is pruned below the limit."""
+    entry = {"date": "2025-01-01"}
+    assert _plan_recent_steps(entry, _entries(3), complete=True) == ([entry], [])
+
+
+def test_plan_recent_steps_prunes_oldest_at_limit():
+    """Test that the oldest entry is pruned once the window is full."""
+    recent = _entries(RECENT_STEPS_DAYS)
+    entry = {"date": "2025-01-01"}
+    added, stale = _plan_recent_steps(entry, recent, complete=True)
+    assert added == [entry]
+    assert stale == [min(recent, key=lambda x: x["date"])]
+
+
+def test_plan_recent_steps_skips_entry_older_than_window():
+    """Test that an entry older than a full window is neither added nor pruned."""
+    entry = {"date": "2000-01-01"}
+    assert _plan_recent_steps(entry, _entries(RECENT_STEPS_DAYS), complete=True) == ([], [])
+
+
+def test_plan_recent_steps_backfills_incomplete_summary():
+    """Test that an incomplete summary is rebuilt from history plus the new entry."""
+    history = _entries(3)
+    entry = {"date": "2025-01-01"}
+    added, stale = _plan_recent_steps(entry, history, complete=False)
+    assert added == [entry, *history]
+    assert stale == []
@@ -2,50 +2,35 @@
 Health check endpoint tests.
 """
 
-import pytest
-from httpx import AsyncClient
-from app.main import app
-
-
-@pytest.mark.asyncio
-async def test_health_check():
-    """Test health check endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/api/v1/health")
-        assert response.status_code == 200
-        data = response.json()
-        assert "status" in data
-        assert "version" in data
-        assert "services" in data
-
+import asyncio
 
-@pytest.mark.asyncio
-async def test_readiness_check():
-    """Test readiness probe endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/api/v1/health/ready")
-        assert response.status_code == 200
-        data = response.json()
-        assert "status" in data
-
-
-@pytest.mark.asyncio
-async def test_liveness_check():
-    """Test liveness probe endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/api/v1/health/live")
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "alive"
+import pytest
 
 
 @pytest.mark.asyncio
-async def test_root_endpoint():
-    """Test root endpoint."""
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        response = await client.get("/")
-        assert response.status_code == 200
-        data = response.json()
-        assert "name" in data
-        assert "version" in data
-        assert "status" in data
+async def test_all_health_endpoints(client):
+    """Test health, readiness, liveness and root endpoints concurrently."""
+    health, ready, live, root = await asyncio.gather(
+        client.get("/api/v1/health"),
+        client.get("/api/v1/health/ready"),
+        client.get("/api/v1/health/live"),
+        client.get("/")
+    )
+
+    assert health.status_code == 200
+    data = health.json()
+    assert "status" in data
+    assert "version" in data
+    assert "services" in data
+
+    assert ready.status_code == 200
+    assert "status" in ready.json()
+
+    assert live.status_code == 200
+    assert live.json()["status"] == "alive"
+
+    assert root.status_code == 200
+    data = root.json()
+    assert "name" in data
+    assert "version" in data
+    assert "status" in data
@@ -0,0 +1,16 @@
+"""
+Schema conformance tests.
+
+Club and step history responses are built with model_construct (no
+validation), so the documents we write must already match the schemas.
+"""
+
+from app.models.schemas import ClubInfo
+from scripts.seed_clubs import CLUBS_DATA
+
+
+def test_seed_clubs_match_club_info_schema():
+    """Test that every seeded club document validates as ClubInfo."""
+    for club in CLUBS_DATA:
+        info = ClubInfo.model_validate(club, strict=True)
+        assert info.model_dump() == club
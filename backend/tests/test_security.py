@@ -0,0 +1,56 @@
+"""
+Security utility tests.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from app.settings import settings
+from app.utils import security
+from app.utils.security import (
+    _get_http_client,
+    close_http_client,
+    create_firebase_user,
+    update_firebase_user
+)
+
+
+@pytest.mark.asyncio
+async def test_http_client_recreated_after_close():
+    """Test that the shared HTTP client is usable again after shutdown closes it."""
+    client = _get_http_client()
+    assert _get_http_client() is client
+
+    await close_http_client()
+
+    new_client = _get_http_client()
+    assert new_client is not client
+    assert not new_client.is_closed
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_firebase_user_calls_use_admin_endpoints(monkeypatch):
+    """Test that account create/update use project-scoped admin endpoints with a bearer token."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"localId": "uid-1"})
+
+    async def fake_token() -> str:
+        return "admin-token"
+
+    monkeypatch.setattr(security, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(security, "_get_admin_access_token", fake_token)
+
+    assert await create_firebase_user("user@example.com", "TestPass123", "User") == "uid-1"
+    await update_firebase_user("uid-1", email="new@example.com")
+    await close_http_client()
+
+    base = f"https://identitytoolkit.googleapis.com/v1/projects/{settings.FIREBASE_PROJECT_ID}/accounts"
+    assert [str(request.url) for request in requests] == [base, f"{base}:update"]
+    assert all(request.headers["Authorization"] == "Bearer admin-token" for request in requests)
+    assert json.loads(requests[1].content) == {"localId": "uid-1", "email": "new@example.com"}
@@ -0,0 +1,86 @@
+"""
+Step service unit tests.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.services.step_service import StepService
+
+
+class _SummaryRepository:
+    """Repository stub serving history reads and failing on any write."""
+
+    def __init__(self, summary=None, history=None):
+        self.summary = summary
+        self.history = history or []
+
+    async def get_step_summary(self, user_id):
+        return self.summary
+
+    async def get_user_step_history(self, user_id, limit=30, after_date=None):
+        return self.history[:limit]
+
+    def __getattr__(self, name):
+        raise AssertionError(f"Unexpected repository call: {name}")
+
+
+@pytest.mark.asyncio
+async def test_recent_history_from_summary_is_sorted_and_limited():
+    """Test that summary entries are returned newest first, up to the limit."""
+    repo = _SummaryRepository(summary={
+        "complete": True,
+        "recent_steps": [{"date": "2025-01-01"}, {"date": "2025-01-03"}, {"date": "2025-01-02"}]
+    })
+    history = await StepService(repo)._get_recent_history("user", 2)
+    assert [log["date"] for log in history] == ["2025-01-03", "2025-01-02"]
+
+
+@pytest.mark.asyncio
+async def test_recent_history_without_summary_reads_step_logs_only():
+    """Test that an incomplete summary falls back to step logs without writing."""
+    repo = _SummaryRepository(history=[{"date": "2025-01-02"}, {"date": "2025-01-01"}])
+    history = await StepService(repo)._get_recent_history("user", 1)
+    assert history == [{"date": "2025-01-02"}]
+
+
+def _days_ago(*offsets):
+    """Dates the given number of days before today."""
+    today = date.today()
+    return [today - timedelta(days=offset) for offset in offsets]
+
+
+@pytest.mark.parametrize(
+    "offsets,expected",
+    [
+        ((), 0),
+        ((0,), 1),
+        ((0, 1, 2), 3),
+        ((0, 1, 3, 4), 2),
+        ((1, 2, 3), 0),
+    ],
+    ids=["empty", "today_only", "three_days", "gap", "not_logged_today"]
+)
+def test_calculate_current_streak(offsets, expected):
+    """Test the current streak over newest-first dates ending today."""
+    service = StepService(repository=None)
+    assert service._calculate_current_streak(_days_ago(*offsets)) == expected
+
+
+@pytest.mark.parametrize(
+    "offsets,expected",
+    [
+        ((), 0),
+        ((5,), 1),
+        ((0, 1, 2, 5, 6), 3),
+        ((9, 0, 7, 8, 1, 10, 3), 4),
+        ((0, 2, 4, 6), 1),
+        ((3, 3, 2, 1), 3),
+    ],
+    ids=["empty", "single_day", "two_runs", "unsorted", "no_consecutive_days", "duplicates"]
+)
+def test_calculate_longest_streak(offsets, expected):
+    """Test the longest streak regardless of order, gaps, or duplicate dates."""
+    service = StepService(repository=None)
+    assert service._calculate_longest_streak(_days_ago(*offsets)) == expected
@@ -0,0 +1,43 @@
+"""
+Validator unit tests.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.models.schemas import StepSyncRequest
+from app.utils.validators import validate_date_format, validate_password_strength
+
+
+@pytest.mark.parametrize(
+    "password,expected",
+    [
+        ("Test1234", (True, "")),
+        ("パスワードAbc1", (True, "")),
+        ("weak", (False, "Password must be at least 8 characters long")),
+        ("test1234", (False, "Password must contain at least one uppercase letter")),
+        ("12345678", (False, "Password must contain at least one uppercase letter")),
+        ("TEST1234", (False, "Password must contain at least one lowercase letter")),
+        ("Testpass", (False, "Password must contain at least one digit")),
+        # Titlecase letters are neither upper- nor lowercase
+        ("abcdefg1ǅ", (False, "Password must contain at least one uppercase letter")),
+        # Non-decimal digits such as superscripts still count as digits
+        ("Abcdefgh²", (True, "")),
+    ]
+)
+def test_validate_password_strength(password, expected):
+    """Test password strength rules, including passwords with uncased characters."""
+    assert validate_password_strength(password) == expected
+
+
+@pytest.mark.parametrize("value", ["2025-10-10\n", "２０２５-１０-１０", "2025-10-10 "])
+def test_step_sync_rejects_malformed_dates(value):
+    """Test that non-canonical date strings are rejected (they become step log IDs)."""
+    assert not validate_date_format(value)
+    with pytest.raises(ValidationError):
+        StepSyncRequest(
+            steps=100,
+            date=value,
+            source="healthkit",
+            device_signature="test_signature"
+        )